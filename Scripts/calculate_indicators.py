@@ -23,9 +23,37 @@ import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 
+# 缓存不同版本pandas_ta返回的列名解析结果（按列名元组索引）
+_PSAR_KEY_CACHE = {}
+_ICHIMOKU_COLUMN_CACHE = {}
+
+# Cloud_Direction逐行比较：安装了numba时JIT编译为单次遍历，否则退回numpy.select
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _cloud_direction(close, span_a, span_b):
+        out = np.zeros(close.shape[0], dtype=np.int8)
+        for i in range(close.shape[0]):
+            if close[i] < span_b[i]:
+                out[i] = -1
+            elif close[i] > span_a[i]:
+                out[i] = 1
+        return out
+
+    # 导入时用单元素数组预热，编译（或加载磁盘缓存）不会落到第一个请求上
+    _cloud_direction(np.zeros(1), np.zeros(1), np.zeros(1))
+else:
+    def _cloud_direction(close, span_a, span_b):
+        # NaN比较结果为False，缺少云数据的行自然落入默认值0
+        return np.select([close < span_b, close > span_a], [-1, 1], default=0).astype(np.int8)
+
 def load_data(file_path):
     """
-    Load market data from a CSV or Excel file.
+    Load market data from a CSV, Excel or parquet file.
     
     Args:
         file_path (str): Path to the data file
@@ -37,6 +65,9 @@ def load_data(file_path):
         data = pd.read_csv(file_path)
     elif file_path.endswith(('.xlsx', '.xls')):
         data = pd.read_excel(file_path)
+    elif file_path.endswith('.parquet'):
+        # Parquet files saved by the API keep the Date index
+        data = pd.read_parquet(file_path)
     else:
         raise ValueError("Unsupported file format")
         
@@ -238,19 +269,21 @@ def calculate_indicators(df, parameter_set='default'):
     # Parabolic SAR
     sar_result = ta.psar(data['High'], data['Low'], data['Close'], af=0.02, max_af=0.2)
     
-    # 处理不同版本pandas_ta库返回的键名差异
-    if 'PSARl_0.020_0.200' in sar_result:
-        data['SAR'] = sar_result['PSARl_0.020_0.200']
-    elif 'PSAR_0.020_0.200' in sar_result:
-        data['SAR'] = sar_result['PSAR_0.020_0.200']
+    # 处理不同版本pandas_ta库返回的键名差异，解析结果按列名缓存
+    sar_columns = tuple(sar_result.columns)
+    psar_key = _PSAR_KEY_CACHE.get(sar_columns)
+    if psar_key is None:
+        psar_key = next((key for key in sar_columns if key.startswith(('PSARl_', 'PSAR_'))), None)
+        if psar_key is None:
+            # 如果找不到已知的键名，尝试寻找包含PSAR的键
+            psar_key = next((key for key in sar_columns if 'PSAR' in key), '')
+        _PSAR_KEY_CACHE[sar_columns] = psar_key
+    
+    if psar_key:
+        data['SAR'] = sar_result[psar_key]
     else:
-        # 如果找不到已知的键名，尝试寻找包含PSAR的键
-        psar_keys = [key for key in sar_result.keys() if 'PSAR' in key]
-        if psar_keys:
-            data['SAR'] = sar_result[psar_keys[0]]
-        else:
-            print(f"Warning: Could not find PSAR result in returned data. Available keys: {sar_result.keys()}")
-            data['SAR'] = np.nan  # 使用NaN作为数据不可用的标识
+        print(f"Warning: Could not find PSAR result in returned data. Available keys: {sar_result.keys()}")
+        data['SAR'] = np.nan  # 使用NaN作为数据不可用的标识
     
     # Calculate Ichimoku Cloud
     if params.get('use_ichimoku', False):
@@ -275,28 +308,29 @@ def calculate_indicators(df, parameter_set='default'):
                 'ICS_26': 'Ichimoku_Chikou'
             }
             
-            for src, dst in ichimoku_mapping.items():
-                if src in ichimoku_df.columns:
-                    data[dst] = ichimoku_df[src]
-                else:
-                    # 尝试找到包含相似前缀的列
-                    similar_found = False
-                    for col in ichimoku_df.columns:
-                        if src.split('_')[0] in col:
-                            data[dst] = ichimoku_df[col]
-                            similar_found = True
-                            break
-                    if not similar_found:
-                        data[dst] = np.nan
+            # 列名映射只在首次遇到该列组合时解析，之后直接复用
+            ichimoku_columns = tuple(ichimoku_df.columns)
+            resolved_mapping = _ICHIMOKU_COLUMN_CACHE.get(ichimoku_columns)
+            if resolved_mapping is None:
+                resolved_mapping = {}
+                for src, dst in ichimoku_mapping.items():
+                    if src in ichimoku_columns:
+                        resolved_mapping[dst] = src
+                    else:
+                        # 尝试找到包含相似前缀的列
+                        prefix = src.split('_')[0]
+                        resolved_mapping[dst] = next((col for col in ichimoku_columns if prefix in col), None)
+                _ICHIMOKU_COLUMN_CACHE[ichimoku_columns] = resolved_mapping
+            
+            for dst, col in resolved_mapping.items():
+                data[dst] = ichimoku_df[col] if col is not None else np.nan
             
             # Calculate Cloud Direction more reliably
-            data['Cloud_Direction'] = 0
-            data_with_cloud = data.dropna(subset=['Ichimoku_SpanA', 'Ichimoku_SpanB'])
-            if not data_with_cloud.empty:
-                mask_above = data_with_cloud['Close'] > data_with_cloud['Ichimoku_SpanA']
-                mask_below = data_with_cloud['Close'] < data_with_cloud['Ichimoku_SpanB']
-                data.loc[mask_above.index, 'Cloud_Direction'] = 1
-                data.loc[mask_below.index, 'Cloud_Direction'] = -1
+            data['Cloud_Direction'] = _cloud_direction(
+                data['Close'].to_numpy(dtype=np.float64),
+                data['Ichimoku_SpanA'].to_numpy(dtype=np.float64),
+                data['Ichimoku_SpanB'].to_numpy(dtype=np.float64)
+            )
             
         except Exception as e:
             print(f"Error calculating Ichimoku Cloud: {e}")
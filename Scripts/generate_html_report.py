@@ -6,6 +6,7 @@ Creates interactive HTML reports with technical analysis indicators
 """
 
 import os
+import functools
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -17,6 +18,21 @@ import json
 # Import core functions
 from calculate_indicators import calculate_indicators
 
+# Project root directory (parent of Scripts), resolved once
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Compiled report template, loaded once per process by _load_template()
+_TEMPLATE = None
+
+def _load_template():
+    """
+    Load and compile the interactive report template from the Templates directory
+    """
+    template_dir = os.path.join(PROJECT_DIR, 'Templates')
+    template_loader = jinja2.FileSystemLoader(searchpath=template_dir)
+    template_env = jinja2.Environment(loader=template_loader)
+    return template_env.get_template('interactive_report_template.html')
+
 def generate_interactive_report(df, symbol, output_dir, report_date=None, parameter_set='default', language='en', standalone=False):
     """
     Generate an interactive HTML report with technical indicators
@@ -64,13 +80,12 @@ def generate_interactive_report(df, symbol, output_dir, report_date=None, parame
     # Prepare strategy signals
     strategy_signals = prepare_strategy_signals(df, latest, translations)
     
-    # Create the report using Jinja2 template
-    template_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Templates')
-    template_loader = jinja2.FileSystemLoader(searchpath=template_dir)
-    template_env = jinja2.Environment(loader=template_loader)
-    template = template_env.get_template('interactive_report_template.html')
+    # Create the report using Jinja2 template (parsed only on first use)
+    global _TEMPLATE
+    if _TEMPLATE is None:
+        _TEMPLATE = _load_template()
     
-    output = template.render(
+    output = _TEMPLATE.render(
         symbol=symbol,
         current_date=current_date,
         parameter_set=parameter_set,
@@ -93,14 +108,18 @@ def generate_interactive_report(df, symbol, output_dir, report_date=None, parame
     print(f"Interactive report saved to {filepath}")
     return filepath
 
+class _FallbackDict(dict):
+    """Translation table that returns the key itself for missing entries"""
+    def __missing__(self, key):
+        return key
+
+@functools.lru_cache(maxsize=8)
 def get_translations(language='en'):
     """
-    Get translations for the specified language from JSON files in the locales directory
+    Get translations for the specified language from JSON files in the locales directory.
+    Results are cached per language; callers must not modify the returned dict.
     """
-    # Find the project root directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_dir = os.path.dirname(script_dir)
-    locales_dir = os.path.join(project_dir, "locales")
+    locales_dir = os.path.join(PROJECT_DIR, "locales")
     
     # Default fallback translations
     default_translations = {
@@ -117,20 +136,20 @@ def get_translations(language='en'):
         locale_file = os.path.join(locales_dir, f"{language}.json")
         if os.path.exists(locale_file):
             with open(locale_file, 'r', encoding='utf-8') as f:
-                return json.loads(f.read())
+                return _FallbackDict(json.loads(f.read()))
         else:
             print(f"Warning: Translation file for '{language}' not found at {locale_file}")
             # Try to load English as fallback
             en_file = os.path.join(locales_dir, "en.json")
             if language != 'en' and os.path.exists(en_file):
                 with open(en_file, 'r', encoding='utf-8') as f:
-                    return json.loads(f.read())
+                    return _FallbackDict(json.loads(f.read()))
             
             # Use hardcoded fallback
-            return default_translations.get(language, default_translations['en'])
+            return _FallbackDict(default_translations.get(language, default_translations['en']))
     except Exception as e:
         print(f"Error loading translation file: {e}")
-        return default_translations.get(language, default_translations['en'])
+        return _FallbackDict(default_translations.get(language, default_translations['en']))
 
 def create_price_ma_chart(df, symbol, parameter_set, translations):
     """
@@ -685,9 +704,7 @@ if __name__ == "__main__":
     
     # Get default output directory
     if args.output is None:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_dir = os.path.dirname(script_dir)
-        output_dir = os.path.join(project_dir, "Reports")
+        output_dir = os.path.join(PROJECT_DIR, "Reports")
     else:
         output_dir = args.output
     
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""
+补丁脚本公共工具
+----------------
+fix_all_compatibility.py 与 fix_pandas_ta.py 共用的辅助函数。
+pandas_ta 安装路径的查找结果会缓存在进程内和磁盘上
+（~/.cache/fanalysis/pandas_ta_path），按 Python 环境（sys.prefix）区分，
+pandas_ta 版本变化时自动失效。
+"""
+
+import os
+import sys
+import json
+import mmap
+import shutil
+import logging
+import functools
+import importlib.util
+import importlib.metadata
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PATH_CACHE_FILE = os.path.expanduser(os.path.join('~', '.cache', 'fanalysis', 'pandas_ta_path'))
+
+# 新旧导入语句长度相同，可以直接原地替换
+NAN_IMPORT_OLD = b'from numpy import NaN as npNaN'
+NAN_IMPORT_NEW = b'from numpy import nan as npNaN'
+
+def get_package_version(dist_name):
+    """读取已安装包的版本号（只读取元数据，不导入包）"""
+    try:
+        return importlib.metadata.version(dist_name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+def _read_path_cache(version):
+    """读取磁盘上缓存的pandas_ta路径，Python环境或版本不匹配、路径已失效时返回None"""
+    try:
+        with open(PATH_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if (cached.get('prefix') == sys.prefix and cached.get('version') == version
+                and os.path.isdir(cached.get('path', ''))):
+            return Path(cached['path'])
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_path_cache(version, path):
+    """将pandas_ta路径写入磁盘缓存"""
+    try:
+        os.makedirs(os.path.dirname(PATH_CACHE_FILE), exist_ok=True)
+        with open(PATH_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'prefix': sys.prefix, 'version': version, 'path': str(path)}, f)
+    except OSError as e:
+        logger.warning(f"无法写入路径缓存: {e}")
+
+@functools.lru_cache(maxsize=None)
+def find_pandas_ta_path():
+    """查找pandas_ta库的安装路径"""
+    version = get_package_version('pandas_ta')
+    if version is not None:
+        cached_path = _read_path_cache(version)
+        if cached_path is not None:
+            logger.info(f"找到pandas_ta安装路径(缓存): {cached_path}")
+            return cached_path
+
+    try:
+        spec = importlib.util.find_spec('pandas_ta')
+        if spec is None:
+            logger.error("找不到pandas_ta库，请确认它已安装")
+            return None
+
+        pandas_ta_path = Path(spec.origin).parent
+        logger.info(f"找到pandas_ta安装路径: {pandas_ta_path}")
+        if version is not None:
+            _write_path_cache(version, pandas_ta_path)
+        return pandas_ta_path
+    except Exception as e:
+        logger.error(f"查找pandas_ta路径时出错: {e}")
+        return None
+
+def backup_file(file_path):
+    """备份文件"""
+    try:
+        backup_path = str(file_path) + '.bak'
+        # 如果备份已存在，不再创建新备份
+        if not os.path.exists(backup_path):
+            shutil.copy2(file_path, backup_path)
+            logger.info(f"已创建备份: {backup_path}")
+        else:
+            logger.info(f"备份已存在: {backup_path}")
+        return True
+    except Exception as e:
+        logger.error(f"创建备份时出错: {e}")
+        return False
+
+def fix_numpy_nan_import(file_path):
+    """修复文件中的numpy NaN导入
+
+    通过mmap在同一个文件句柄上查找并原地替换导入语句，不需要解码和重写整个文件。
+    """
+    try:
+        with open(file_path, 'r+b') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                logger.info(f"文件无需修复: {file_path}")
+                return False
+
+            with mmap.mmap(f.fileno(), 0) as mm:
+                pos = mm.find(NAN_IMPORT_OLD)
+                if pos < 0:
+                    logger.info(f"文件无需修复: {file_path}")
+                    return False
+
+                # 备份原文件
+                if not backup_file(file_path):
+                    return False
+
+                while pos >= 0:
+                    mm[pos:pos + len(NAN_IMPORT_OLD)] = NAN_IMPORT_NEW
+                    pos = mm.find(NAN_IMPORT_OLD, pos + len(NAN_IMPORT_NEW))
+                mm.flush()
+
+        # 通过映射写入不一定会更新修改时间（Windows），文件大小也不变，
+        # 显式更新修改时间，使__pycache__中按修改时间和大小校验的.pyc失效
+        os.utime(file_path)
+        logger.info(f"成功修复文件: {file_path}")
+        return True
+    except Exception as e:
+        logger.error(f"修复文件时出错: {e}")
+        return False
@@ -11,13 +11,13 @@ Python 3.13 & pandas_ta 兼容性修复工具
 
 import os
 import sys
-import importlib.util
+import json
 import traceback
 import logging
-import shutil
 import pandas as pd
 import numpy as np
-from pathlib import Path
+
+from _common import find_pandas_ta_path, get_package_version, backup_file, fix_numpy_nan_import
 
 # 配置日志
 logging.basicConfig(level=logging.INFO, 
@@ -28,64 +28,25 @@ logging.basicConfig(level=logging.INFO,
                     ])
 logger = logging.getLogger(__name__)
 
-def find_module_path(module_name):
-    """查找模块的安装路径"""
+def load_patch_manifest(manifest_path, version):
+    """读取补丁清单，清单不存在或版本不匹配时返回None"""
     try:
-        spec = importlib.util.find_spec(module_name)
-        if spec is None:
-            logger.error(f"找不到模块 {module_name}，请确认它已安装")
-            return None
-        
-        module_path = Path(spec.origin).parent
-        logger.info(f"找到 {module_name} 安装路径: {module_path}")
-        return module_path
-    except Exception as e:
-        logger.error(f"查找 {module_name} 路径时出错: {e}")
-        traceback.print_exc()
-        return None
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == version:
+            return manifest.get('files', [])
+    except (OSError, ValueError):
+        pass
+    return None
 
-def backup_file(file_path):
-    """备份文件"""
+def save_patch_manifest(manifest_path, version, files):
+    """保存需要修复的文件清单，供后续运行直接使用"""
     try:
-        backup_path = str(file_path) + '.bak'
-        # 如果备份已存在，不再创建新备份
-        if not os.path.exists(backup_path):
-            shutil.copy2(file_path, backup_path)
-            logger.info(f"已创建备份: {backup_path}")
-        else:
-            logger.info(f"备份已存在: {backup_path}")
-        return True
-    except Exception as e:
-        logger.error(f"创建备份时出错: {e}")
-        traceback.print_exc()
-        return False
-
-def fix_numpy_nan_import(file_path):
-    """修复文件中的 numpy NaN 导入问题"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 替换导入语句
-        if 'from numpy import NaN as npNaN' in content:
-            content = content.replace('from numpy import NaN as npNaN', 'from numpy import nan as npNaN')
-            logger.info(f"替换 NaN 导入语句: {file_path}")
-            
-            # 备份原文件
-            if backup_file(file_path):
-                # 写回修改后的内容
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                logger.info(f"成功修复 NaN 导入问题: {file_path}")
-                return True
-        else:
-            logger.info(f"文件无需修复 NaN 导入: {file_path}")
-        
-        return False
-    except Exception as e:
-        logger.error(f"修复 NaN 导入时出错: {e}")
-        traceback.print_exc()
-        return False
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': version, 'files': files}, f, ensure_ascii=False, indent=2)
+        logger.info(f"已保存补丁清单: {manifest_path}")
+    except OSError as e:
+        logger.warning(f"无法保存补丁清单: {e}")
 
 def create_compatibility_patch(script_path):
     """创建兼容性补丁，修改项目中的calculate_indicators.py文件"""
@@ -108,29 +69,72 @@ def create_compatibility_patch(script_path):
             content = content.replace('import pandas as pd', 'import pandas as pd\nimport numpy as np')
             logger.info(f"添加 numpy 导入: {script_path}")
         
-        # 修改2: 增强Parabolic SAR处理逻辑
+        # 修改2: 添加模块级列名缓存，避免每次计算指标都重新扫描返回列
+        cache_marker = "_PSAR_KEY_CACHE = {}"
+        cache_block = """# 缓存不同版本pandas_ta返回的列名解析结果（按列名元组索引）
+_PSAR_KEY_CACHE = {}
+_ICHIMOKU_COLUMN_CACHE = {}
+
+def load_data("""
+        if cache_marker not in content and 'def load_data(' in content:
+            content = content.replace('def load_data(', cache_block, 1)
+            logger.info(f"添加列名缓存: {script_path}")
+        
+        # 添加Cloud_Direction计算函数（numba可用时JIT编译，否则使用numpy.select）
+        cloud_dir_helper = """# Cloud_Direction逐行比较：安装了numba时JIT编译为单次遍历，否则退回numpy.select
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _cloud_direction(close, span_a, span_b):
+        out = np.zeros(close.shape[0], dtype=np.int8)
+        for i in range(close.shape[0]):
+            if close[i] < span_b[i]:
+                out[i] = -1
+            elif close[i] > span_a[i]:
+                out[i] = 1
+        return out
+
+    # 导入时用单元素数组预热，编译（或加载磁盘缓存）不会落到第一个请求上
+    _cloud_direction(np.zeros(1), np.zeros(1), np.zeros(1))
+else:
+    def _cloud_direction(close, span_a, span_b):
+        # NaN比较结果为False，缺少云数据的行自然落入默认值0
+        return np.select([close < span_b, close > span_a], [-1, 1], default=0).astype(np.int8)
+
+def load_data("""
+        if 'def _cloud_direction(' not in content and 'def load_data(' in content:
+            content = content.replace('def load_data(', cloud_dir_helper, 1)
+            logger.info(f"添加 Cloud Direction 计算函数: {script_path}")
+        
+        # 修改3: 增强Parabolic SAR处理逻辑
         psar_pattern = "sar_result = ta.psar(data['High'], data['Low'], data['Close'], af=0.02, max_af=0.2)\n    data['SAR'] = sar_result['PSARl_0.020_0.200']"
         psar_replacement = """sar_result = ta.psar(data['High'], data['Low'], data['Close'], af=0.02, max_af=0.2)
     
-    # 处理不同版本pandas_ta库返回的键名差异
-    if 'PSARl_0.020_0.200' in sar_result:
-        data['SAR'] = sar_result['PSARl_0.020_0.200']
-    elif 'PSAR_0.020_0.200' in sar_result:
-        data['SAR'] = sar_result['PSAR_0.020_0.200']
+    # 处理不同版本pandas_ta库返回的键名差异，解析结果按列名缓存
+    sar_columns = tuple(sar_result.columns)
+    psar_key = _PSAR_KEY_CACHE.get(sar_columns)
+    if psar_key is None:
+        psar_key = next((key for key in sar_columns if key.startswith(('PSARl_', 'PSAR_'))), None)
+        if psar_key is None:
+            # 如果找不到已知的键名，尝试寻找包含PSAR的键
+            psar_key = next((key for key in sar_columns if 'psar' in key.lower()), '')
+        _PSAR_KEY_CACHE[sar_columns] = psar_key
+    
+    if psar_key:
+        data['SAR'] = sar_result[psar_key]
     else:
-        # 如果找不到已知的键名，尝试寻找包含PSAR的键
-        psar_keys = [key for key in sar_result.keys() if 'PSAR' in key or 'psar' in key.lower()]
-        if psar_keys:
-            data['SAR'] = sar_result[psar_keys[0]]
-        else:
-            print(f"Warning: 找不到PSAR结果。可用键: {list(sar_result.keys())}")
-            data['SAR'] = np.nan  # 使用NaN作为数据不可用的标识"""
+        print(f"Warning: 找不到PSAR结果。可用键: {list(sar_columns)}")
+        data['SAR'] = np.nan  # 使用NaN作为数据不可用的标识"""
         
         if psar_pattern in content:
             content = content.replace(psar_pattern, psar_replacement)
             logger.info(f"增强 PSAR 处理逻辑: {script_path}")
         
-        # 修改3: 增强Ichimoku Cloud处理逻辑
+        # 修改4: 增强Ichimoku Cloud处理逻辑
         ichimoku_pattern_start = "        try:\n            ichimoku_result = ta.ichimoku(data['High'], data['Low'], data['Close'], "
         ichimoku_pattern_end = "            # Calculate Cloud Direction more reliably\n            data['Cloud_Direction'] = 0"
         
@@ -163,19 +167,22 @@ def create_compatibility_patch(script_path):
                 'ICS_26': 'Ichimoku_Chikou'
             }
             
-            for src, dst in ichimoku_mapping.items():
-                if src in ichimoku_df.columns:
-                    data[dst] = ichimoku_df[src]
-                else:
-                    # 尝试找到包含相似前缀的列
-                    similar_found = False
-                    for col in ichimoku_df.columns:
-                        if src.split('_')[0] in col:
-                            data[dst] = ichimoku_df[col]
-                            similar_found = True
-                            break
-                    if not similar_found:
-                        data[dst] = np.nan
+            # 列名映射只在首次遇到该列组合时解析，之后直接复用
+            ichimoku_columns = tuple(ichimoku_df.columns)
+            resolved_mapping = _ICHIMOKU_COLUMN_CACHE.get(ichimoku_columns)
+            if resolved_mapping is None:
+                resolved_mapping = {}
+                for src, dst in ichimoku_mapping.items():
+                    if src in ichimoku_columns:
+                        resolved_mapping[dst] = src
+                    else:
+                        # 尝试找到包含相似前缀的列
+                        prefix = src.split('_')[0]
+                        resolved_mapping[dst] = next((col for col in ichimoku_columns if prefix in col), None)
+                _ICHIMOKU_COLUMN_CACHE[ichimoku_columns] = resolved_mapping
+            
+            for dst, col in resolved_mapping.items():
+                data[dst] = ichimoku_df[col] if col is not None else np.nan
             
             # Calculate Cloud Direction more reliably"""
                 
@@ -183,15 +190,13 @@ def create_compatibility_patch(script_path):
                 content = content[:start_pos] + ichimoku_replacement + content[end_pos:]
                 logger.info(f"增强 Ichimoku Cloud 处理逻辑: {script_path}")
         
-        # 修改4: 增强Cloud Direction计算逻辑
+        # 修改5: 增强Cloud Direction计算逻辑
         cloud_dir_pattern = "            data['Cloud_Direction'] = 0\n            mask_above = data['Close'] > data['Ichimoku_SpanA']\n            mask_below = data['Close'] < data['Ichimoku_SpanB']\n            data.loc[mask_above, 'Cloud_Direction'] = 1\n            data.loc[mask_below, 'Cloud_Direction'] = -1"
-        cloud_dir_replacement = """            data['Cloud_Direction'] = 0
-            data_with_cloud = data.dropna(subset=['Ichimoku_SpanA', 'Ichimoku_SpanB'])
-            if not data_with_cloud.empty:
-                mask_above = data_with_cloud['Close'] > data_with_cloud['Ichimoku_SpanA']
-                mask_below = data_with_cloud['Close'] < data_with_cloud['Ichimoku_SpanB']
-                data.loc[mask_above.index, 'Cloud_Direction'] = 1
-                data.loc[mask_below.index, 'Cloud_Direction'] = -1"""
+        cloud_dir_replacement = """            data['Cloud_Direction'] = _cloud_direction(
+                data['Close'].to_numpy(dtype=np.float64),
+                data['Ichimoku_SpanA'].to_numpy(dtype=np.float64),
+                data['Ichimoku_SpanB'].to_numpy(dtype=np.float64)
+            )"""
         
         if cloud_dir_pattern in content:
             content = content.replace(cloud_dir_pattern, cloud_dir_replacement)
@@ -259,22 +264,43 @@ def test_indicator_calculation():
         traceback.print_exc()
         return False
 
-def fix_all_pandas_ta_files():
-    """修复所有pandas_ta相关文件"""
+def fix_all_pandas_ta_files(rescan=False):
+    """修复所有pandas_ta相关文件
+    
+    需要修复的文件列表缓存在pandas_ta目录下的.patch_manifest.json中，
+    只有清单不存在、pandas_ta版本变化或指定rescan时才重新扫描momentum目录。
+    """
     try:
-        pandas_ta_path = find_module_path('pandas_ta')
+        pandas_ta_path = find_pandas_ta_path()
         if not pandas_ta_path:
             return False
         
-        # 修复squeeze_pro.py中的NaN导入
-        squeeze_pro_path = pandas_ta_path / 'momentum' / 'squeeze_pro.py'
-        if os.path.exists(squeeze_pro_path):
-            fix_numpy_nan_import(squeeze_pro_path)
+        manifest_path = pandas_ta_path / '.patch_manifest.json'
+        version = get_package_version('pandas_ta')
+        target_files = None if rescan else load_patch_manifest(manifest_path, version)
+        
+        if target_files is None:
+            # squeeze_pro.py中的NaN导入是已知问题，始终包含在清单中
+            target_files = []
+            if os.path.exists(pandas_ta_path / 'momentum' / 'squeeze_pro.py'):
+                target_files.append('momentum/squeeze_pro.py')
+            
+            # 扫描其他可能需要修复的文件
+            for file_path in (pandas_ta_path / 'momentum').glob('*.py'):
+                relative_path = file_path.relative_to(pandas_ta_path).as_posix()
+                if relative_path in target_files:
+                    continue
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    if 'import NaN' in f.read():
+                        target_files.append(relative_path)
+            
+            save_patch_manifest(manifest_path, version, target_files)
+        else:
+            logger.info(f"使用补丁清单，共 {len(target_files)} 个文件")
         
-        # 添加其他可能需要修复的文件
-        momentum_files = (pandas_ta_path / 'momentum').glob('*.py')
-        for file_path in momentum_files:
-            if 'import NaN' in open(file_path, 'r', encoding='utf-8').read():
+        for relative_path in target_files:
+            file_path = pandas_ta_path / relative_path
+            if os.path.exists(file_path):
                 fix_numpy_nan_import(file_path)
         
         return True
@@ -287,8 +313,8 @@ def main():
     """主函数"""
     logger.info("开始全面兼容性修复...")
     
-    # 1. 修复pandas_ta库中的问题
-    fix_all_pandas_ta_files()
+    # 1. 修复pandas_ta库中的问题（--rescan 强制重新扫描需要修复的文件）
+    fix_all_pandas_ta_files(rescan='--rescan' in sys.argv)
     
     # 2. 修改项目中的calculate_indicators.py文件
     script_path = "e:/FAnalysis/Scripts/calculate_indicators.py"
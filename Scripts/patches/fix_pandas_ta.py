@@ -9,72 +9,14 @@
 
 import os
 import sys
-from pathlib import Path
-import importlib.util
-import shutil
 import logging
 
+from _common import find_pandas_ta_path, fix_numpy_nan_import
+
 # 配置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def find_pandas_ta_path():
-    """查找pandas_ta库的安装路径"""
-    try:
-        spec = importlib.util.find_spec('pandas_ta')
-        if spec is None:
-            logger.error("找不到pandas_ta库，请确认它已安装")
-            return None
-        
-        pandas_ta_path = Path(spec.origin).parent
-        logger.info(f"找到pandas_ta安装路径: {pandas_ta_path}")
-        return pandas_ta_path
-    except Exception as e:
-        logger.error(f"查找pandas_ta路径时出错: {e}")
-        return None
-
-def backup_file(file_path):
-    """备份文件"""
-    try:
-        backup_path = str(file_path) + '.bak'
-        # 如果备份已存在，不再创建新备份
-        if not os.path.exists(backup_path):
-            shutil.copy2(file_path, backup_path)
-            logger.info(f"已创建备份: {backup_path}")
-        else:
-            logger.info(f"备份已存在: {backup_path}")
-        return True
-    except Exception as e:
-        logger.error(f"创建备份时出错: {e}")
-        return False
-
-def fix_numpy_nan_import(file_path):
-    """修复文件中的numpy NaN导入"""
-    try:
-        # 读取文件内容
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 替换导入语句
-        if 'from numpy import NaN as npNaN' in content:
-            content = content.replace('from numpy import NaN as npNaN', 'from numpy import nan as npNaN')
-            logger.info(f"替换导入语句: {file_path}")
-            
-            # 备份原文件
-            if backup_file(file_path):
-                # 写回修改后的内容
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                logger.info(f"成功修复文件: {file_path}")
-                return True
-        else:
-            logger.info(f"文件无需修复: {file_path}")
-        
-        return False
-    except Exception as e:
-        logger.error(f"修复文件时出错: {e}")
-        return False
-
 def main():
     """主函数"""
     logger.info("开始修复pandas_ta库与NumPy的兼容性问题...")
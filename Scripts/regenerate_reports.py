@@ -2,61 +2,120 @@
 """
 Report Regenerator
 -----------------
-Regenerates all HTML reports with the correct image paths.
+Regenerates all interactive HTML reports with the current report template.
 """
 
 import os
-import glob
+import re
 import sys
 import traceback
-from generate_html_report import generate_html_report
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from calculate_indicators import calculate_indicators, load_data
+from generate_html_report import generate_interactive_report, PROJECT_DIR
+
+REPORTS_DIR = os.path.join(PROJECT_DIR, "Reports")
+DATA_DIR = os.path.join(PROJECT_DIR, "Data")
+
+# Interactive report filename: SYMBOL_interactive_report_YYYYMMDD_PARAMETER_SET.html
+REPORT_FILENAME_RE = re.compile(r'^(?P<symbol>[^_]+)_interactive_report_(?P<date>\d{8})_(?P<parameter_set>.+)\.html$')
+
+# The report template records its language in <html lang> and adds X-Frame-Options for standalone reports
+REPORT_LANG_RE = re.compile(r'<html lang="(?P<language>[a-z]+)">')
+STANDALONE_MARKER = 'http-equiv="X-Frame-Options"'
+
+def _init_worker():
+    """Preload the report template once per worker process."""
+    import generate_html_report as report_module
+    report_module._TEMPLATE = report_module._load_template()
+
+def _read_report_options(file_path):
+    """Read the language and standalone flag an existing report was generated with, or None if unknown."""
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        head = f.read(2048)
+    match = REPORT_LANG_RE.search(head)
+    if not match:
+        return None
+    return match['language'], STANDALONE_MARKER in head
+
+def _find_data_file(symbol, date):
+    """Find the data file the report was generated from, in the same order as the API."""
+    for filename in (f"{symbol}_{date}_fixed.csv", f"{symbol}_{date}.parquet", f"{symbol}_{date}.csv"):
+        file_path = os.path.join(DATA_DIR, filename)
+        if os.path.exists(file_path):
+            return file_path
+    raise FileNotFoundError(f"No data file found for {symbol} on {date}")
+
+def _regenerate_report(symbol, date, parameter_set, language, standalone):
+    """Regenerate a single interactive report from the data file of its date."""
+    data = load_data(_find_data_file(symbol, date))
+    indicator_data = calculate_indicators(data, parameter_set=parameter_set)
+    
+    # Generate HTML report
+    return generate_interactive_report(
+        indicator_data,
+        symbol,
+        REPORTS_DIR,
+        report_date=date,
+        parameter_set=parameter_set,
+        language=language,
+        standalone=standalone
+    )
 
 def main():
-    """Regenerate all HTML reports."""
+    """Regenerate all interactive HTML reports."""
     print("Starting report regeneration...")
     
-    # Get the Reports directory
-    reports_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Reports")
-    
-    # Find all indicator report files
-    report_files = glob.glob(os.path.join(reports_dir, "*_indicator_report_*.txt"))
+    # Find all interactive report files and the options they were generated with
+    reports = []
+    skipped_count = 0
+    if os.path.isdir(REPORTS_DIR):
+        with os.scandir(REPORTS_DIR) as entries:
+            for entry in entries:
+                match = REPORT_FILENAME_RE.match(entry.name)
+                if not match:
+                    continue
+                options = _read_report_options(entry.path)
+                if options is None:
+                    # Regenerating with default options could overwrite a Chinese or standalone report
+                    print(f"Skipping {entry.name}: report language could not be determined")
+                    skipped_count += 1
+                    continue
+                reports.append((entry.name, match['symbol'], match['date'], match['parameter_set'], *options))
     
-    if not report_files:
-        print("No indicator reports found.")
+    if not reports:
+        print("No interactive reports found.")
         return
     
-    print(f"Found {len(report_files)} reports to regenerate.\n")
+    print(f"Found {len(reports)} reports to regenerate.\n")
     
     success_count = 0
     error_count = 0
     
-    # Process each report
-    for i, file_path in enumerate(report_files, 1):
-        try:
-            filename = os.path.basename(file_path)
-            symbol = filename.split('_indicator_report_')[0]
-            date = filename.split('_indicator_report_')[1].replace('.txt', '')
-            
-            print(f"[{i}/{len(report_files)}] Regenerating {symbol} report for {date}...")
-            
-            # Generate HTML report
-            output_path = generate_html_report(symbol, date)
-            print(f"  ✓ Report generated: {os.path.basename(output_path)}")
-            success_count += 1
+    # Process reports in parallel; each worker loads the template once up front
+    with ProcessPoolExecutor(initializer=_init_worker) as executor:
+        futures = {executor.submit(_regenerate_report, symbol, date, parameter_set, language, standalone): filename
+                   for filename, symbol, date, parameter_set, language, standalone in reports}
+        
+        for i, future in enumerate(as_completed(futures), 1):
+            filename = futures[future]
+            try:
+                output_path = future.result()
+                print(f"[{i}/{len(reports)}] ✓ Report generated: {os.path.basename(output_path)}")
+                success_count += 1
             
-        except Exception as e:
-            error_count += 1
-            print(f"  ✗ Error processing {os.path.basename(file_path)}: {str(e)}")
-            if '--verbose' in sys.argv:
-                print("  Detailed error traceback:")
-                traceback.print_exc()
+            except Exception as e:
+                error_count += 1
+                print(f"[{i}/{len(reports)}] ✗ Error processing {filename}: {str(e)}")
+                if '--verbose' in sys.argv:
+                    print("  Detailed error traceback:")
+                    traceback.print_exc()
     
     print("\nReport regeneration complete!")
-    print(f"Summary: {success_count} reports generated successfully, {error_count} failed")
+    print(f"Summary: {success_count} reports generated successfully, {error_count} failed, {skipped_count} skipped")
     
     if error_count > 0:
         print("\nTo view detailed error information, run with the --verbose flag")
         print("Command: python regenerate_reports.py --verbose")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -6,6 +6,30 @@ import yfinance as yf
 from datetime import datetime, timedelta
 import pandas as pd
 
+def get_last_date(file_path):
+    """
+    读取已保存CSV文件最后一行的日期，只读取文件末尾而不解析整个文件
+    
+    参数:
+    file_path (str): CSV文件路径
+    
+    返回:
+    pandas.Timestamp: 最后一行的日期，无法解析时返回None
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 4096))
+            lines = f.read().splitlines()
+        
+        for line in reversed(lines):
+            line = line.decode('utf-8').strip()
+            if line:
+                return pd.to_datetime(line.split(',')[0]).tz_localize(None)
+    except Exception:
+        return None
+    return None
+
 def update_market_data(symbols_file, output_dir, period="1y", interval="1d"):
     """
     批量更新金融产品数据
@@ -37,16 +61,34 @@ def update_market_data(symbols_file, output_dir, period="1y", interval="1d"):
     start_date = (today - timedelta(days=365)).strftime('%Y-%m-%d')
     end_date = today.strftime('%Y-%m-%d')
     
+    # 只有日线数据增量获取最后一次保存之后的部分；周线/月线的最后一根K线仍在形成中，
+    # 追加会产生重复行，仍然整体重新下载
+    incremental = interval == '1d'
+    
     # 获取所有符号的数据
     total = len(symbols)
     for i, symbol in enumerate(symbols, 1):
         try:
             print(f"正在获取第 {i}/{total} 个产品 {symbol} 的数据...")
             
+            # 确保产品目录存在
+            symbol_dir = os.path.join(output_dir, symbol.replace('=', '_').replace('^', ''))
+            os.makedirs(symbol_dir, exist_ok=True)
+            output_file = os.path.join(symbol_dir, f"{symbol.replace('=', '_').replace('^', '')}_daily.csv")
+            
+            # 已有数据文件时，从最后一个日期的下一天开始获取
+            symbol_start = start_date
+            last_date = get_last_date(output_file) if incremental and os.path.exists(output_file) else None
+            if last_date is not None:
+                symbol_start = (last_date + timedelta(days=1)).strftime('%Y-%m-%d')
+                if symbol_start >= end_date:
+                    print(f"{symbol} 的数据已是最新，跳过")
+                    continue
+            
             # 使用yfinance获取数据
             data = yf.download(
                 symbol,
-                start=start_date,
+                start=symbol_start,
                 end=end_date,
                 interval=interval
             )
@@ -54,14 +96,12 @@ def update_market_data(symbols_file, output_dir, period="1y", interval="1d"):
             if data.empty:
                 print(f"警告: {symbol} 没有获取到数据")
                 continue
-                
-            # 确保产品目录存在
-            symbol_dir = os.path.join(output_dir, symbol.replace('=', '_').replace('^', ''))
-            os.makedirs(symbol_dir, exist_ok=True)
             
-            # 保存数据
-            output_file = os.path.join(symbol_dir, f"{symbol.replace('=', '_').replace('^', '')}_daily.csv")
-            data.to_csv(output_file)
+            # 保存数据，增量数据追加到已有文件末尾
+            # 使用1MB写缓冲并固定换行符，减少小块刷写次数
+            mode = 'a' if last_date is not None else 'w'
+            with open(output_file, mode, encoding='utf-8', newline='', buffering=1 << 20) as f:
+                data.to_csv(f, header=(mode == 'w'), lineterminator='\n')
             print(f"已成功保存 {symbol} 的数据到 {output_file}")
             
         except Exception as e:
@@ -10,30 +10,107 @@ import sys
 import pandas as pd
 import numpy as np
 import json
+import re
+import functools
+import importlib.util
+import mimetypes
+import time
+import tempfile
 from datetime import datetime, timedelta
-from flask import Flask, request, jsonify, send_from_directory
+from pathlib import Path
+from flask import Flask, request, jsonify, send_from_directory, make_response, abort
+from werkzeug.utils import safe_join
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import plotly
+import plotly.graph_objects as go
 import yfinance as yf
-import glob
+import itertools
+import threading
 import logging
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is optional; jsonify falls back to the standard json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# redis is optional; short-lived responses are cached per process without it
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# flask-compress is optional; responses are sent uncompressed without it
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# Downloaded data is stored as parquet when a parquet engine is installed, CSV otherwise
+PARQUET_AVAILABLE = any(importlib.util.find_spec(engine) is not None for engine in ('pyarrow', 'fastparquet'))
+
+# pyarrow's multithreaded CSV reader is used for data files when it is installed
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Project root, resolved once
+BASE_DIR = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = str(BASE_DIR / 'Scripts')
 
 # Add Scripts directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scripts'))
+sys.path.append(SCRIPTS_DIR)
 
 # Import core functions from existing codebase
 from calculate_indicators import calculate_indicators, load_data
 from generate_charts import generate_parameter_set_charts, plot_interactive_indicators, plot_interactive_bollinger
+from generate_html_report import generate_interactive_report
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes responses with orjson"""
+    # Keep jsonify's sorted keys and leave datetimes to the default HTTP date format;
+    # numpy scalars and arrays (e.g. values read straight from a DataFrame) are encoded natively
+    option = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+              | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+    
+    def dumps(self, obj, **kwargs):
+        # orjson has no indent/separators options; let the json module handle those calls
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.option).decode('utf-8')
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option),
+            mimetype=self.mimetype
+        )
 
 # Create Flask application
 app = Flask(__name__, static_folder='../web/build')
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for all routes
+if Compress is not None:
+    Compress(app)  # gzip/br for HTML and JSON responses
 
 # Configure directories
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DATA_DIR = os.path.join(BASE_DIR, 'Data')
-CHARTS_DIR = os.path.join(BASE_DIR, 'Charts')
-REPORTS_DIR = os.path.join(BASE_DIR, 'Reports')
+DATA_DIR = str(BASE_DIR / 'Data')
+CHARTS_DIR = str(BASE_DIR / 'Charts')
+REPORTS_DIR = str(BASE_DIR / 'Reports')
+
+# Let the front-end server transfer chart and report files when configured.
+# USE_X_SENDFILE=1 enables X-Sendfile (Apache mod_xsendfile, lighttpd).
+# X_ACCEL_PREFIX=/_internal enables nginx X-Accel-Redirect, e.g.:
+#   location /_internal/reports/ { internal; alias /path/to/Reports/; }
+#   location /_internal/charts/  { internal; alias /path/to/Charts/; }
+app.use_x_sendfile = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+X_ACCEL_PREFIX = os.environ.get('X_ACCEL_PREFIX', '').rstrip('/')
+
+# HTML files up to this size are gzipped in-process when flask-compress is installed;
+# larger reports are sent as-is and left to the front-end server's gzip
+COMPRESS_MAX_FILE_SIZE = 2 * 1024 * 1024
 
 # Ensure directories exist
 os.makedirs(DATA_DIR, exist_ok=True)
@@ -51,96 +128,361 @@ AVAILABLE_ASSETS = {
     'indices': ['S&P500', 'NASDAQ', 'DOW']
 }
 
-PARAMETER_SETS = [
+# Flat lookup of every available symbol, built once
+VALID_SYMBOLS = frozenset(itertools.chain.from_iterable(AVAILABLE_ASSETS.values()))
+
+# Key assets shown on the market summary dashboard, flattened once at import
+MARKET_SUMMARY_SYMBOLS = ('EURUSD', 'GOLD', 'OIL', 'S&P500', 'NASDAQ')
+
+# Parameter sets in display order; the frozenset is used for validation
+PARAMETER_SETS_LIST = [
     'default', 'short_term', 'medium_term', 'high_freq', 
     'tight_channel', 'wide_channel', 'trend_following',
     'momentum', 'volatility', 'ichimoku'
 ]
+PARAMETER_SETS = frozenset(PARAMETER_SETS_LIST)
+PARAMETER_SETS_TEXT = ", ".join(PARAMETER_SETS_LIST)
+
+# Layout for the fallback price chart, built once
+FALLBACK_CHART_LAYOUT = go.Layout(
+    xaxis=dict(title='Date', showgrid=True),
+    yaxis=dict(title='Price', showgrid=True),
+    template='plotly_white',
+    showlegend=True
+)
+
+# Optimal indicator sets by asset type
+OPTIMAL_INDICATORS = {
+    'forex': ['SMA(50,200)', 'Bollinger Bands(20)', 'MACD(12,26)', 'RSI(14)'],
+    'commodities': ['SMA(200)', 'Bollinger Bands(50)', 'ATR(14)', 'Ichimoku'],
+    'indices': ['EMA(9,21)', 'Bollinger Bands(20)', 'MACD(12,26)', 'Volume Profile']
+}
+DEFAULT_OPTIMAL_INDICATORS = ['SMA(50)', 'Bollinger Bands(20)', 'RSI(14)']
+
+# Constant responses serialized once at import, with the same encoder jsonify uses
+ASSETS_JSON = app.json.dumps(AVAILABLE_ASSETS)
+PARAMETERS_JSON = app.json.dumps(PARAMETER_SETS_LIST)
+OPTIMAL_INDICATORS_JSON = {asset_type: app.json.dumps(indicators) for asset_type, indicators in OPTIMAL_INDICATORS.items()}
+DEFAULT_OPTIMAL_INDICATORS_JSON = app.json.dumps(DEFAULT_OPTIMAL_INDICATORS)
+
+def json_response(body):
+    """Wrap a pre-serialized JSON body in a response"""
+    return app.response_class(body, mimetype='application/json')
+
+# Response cache: shared through Redis when REDIS_URL is set, otherwise per process
+REDIS_URL = os.environ.get('REDIS_URL')
+redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True) if redis is not None and REDIS_URL else None
+_local_cache = {}
+
+def cache_get(key):
+    """Return a cached JSON-compatible value, or None if missing or expired"""
+    if redis_client is not None:
+        try:
+            value = redis_client.get(key)
+            return None if value is None else json.loads(value)
+        except redis.RedisError as e:
+            logger.warning(f"Redis unavailable, using local cache: {str(e)}")
+    
+    entry = _local_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def cache_set(key, value, ttl):
+    """Cache a JSON-compatible value for ttl seconds"""
+    if redis_client is not None:
+        try:
+            redis_client.set(key, json.dumps(value), ex=ttl)
+            return
+        except redis.RedisError as e:
+            logger.warning(f"Redis unavailable, using local cache: {str(e)}")
+    
+    _local_cache[key] = (time.monotonic() + ttl, value)
 
 # Helper functions
+# 数据目录的文件列表缓存，目录修改时间变化时刷新
+_data_dir_lock = threading.Lock()
+_data_dir_cache = {'mtime': None, 'names': frozenset()}
+
+def list_data_dir():
+    """返回数据目录中的文件名集合，目录未变化时不再重新扫描"""
+    mtime = os.stat(DATA_DIR).st_mtime_ns
+    with _data_dir_lock:
+        if _data_dir_cache['mtime'] != mtime:
+            _data_dir_cache['names'] = frozenset(os.listdir(DATA_DIR))
+            _data_dir_cache['mtime'] = mtime
+        return _data_dir_cache['names']
+
+@functools.lru_cache(maxsize=64)
+def latest_fixed_filename(symbol, data_files):
+    """
+    返回标的最新的修复文件名（文件名中的YYYYMMDD按字典序即按日期排序），没有时返回None
+    
+    data_files是list_data_dir()返回的集合，目录未变化时是同一个对象，缓存直接命中
+    """
+    prefix = f"{symbol}_"
+    return max((name for name in data_files if name.startswith(prefix) and name.endswith('_fixed.csv')),
+               default=None)
+
+@functools.lru_cache(maxsize=64)
+def _parse_data_csv(file_path, mtime_ns, skip_ticker_rows):
+    """解析数据文件并以日期为索引，按(路径, 修改时间)缓存；没有Date列时返回None"""
+    # pyarrow引擎不支持按行号跳过，带ticker行的原始文件仍使用C引擎；pyarrow解析失败时也退回C引擎
+    data = None
+    if PYARROW_AVAILABLE and not skip_ticker_rows:
+        try:
+            data = pd.read_csv(file_path, engine='pyarrow')
+        except Exception as e:
+            logger.warning(f"pyarrow无法解析 {os.path.basename(file_path)}，改用默认引擎: {str(e)}")
+    if data is None:
+        data = pd.read_csv(file_path, skiprows=[1, 2] if skip_ticker_rows else None)
+    if 'Date' not in data.columns:
+        return None
+    data['Date'] = pd.to_datetime(data['Date'], utc=True)
+    data.set_index('Date', inplace=True)
+    # 记录数据来源，指标结果缓存以此为键（attrs会随copy/dropna传递）
+    data.attrs['source'] = (file_path, mtime_ns)
+    return data
+
+def read_data_csv(file_path, skip_ticker_rows=False):
+    """读取数据文件，文件未修改时直接使用缓存的解析结果（返回副本，调用方可以随意修改）"""
+    data = _parse_data_csv(file_path, os.stat(file_path).st_mtime_ns, skip_ticker_rows)
+    return None if data is None else data.copy()
+
+@functools.lru_cache(maxsize=64)
+def _parse_data_parquet(file_path, mtime_ns):
+    """读取parquet数据文件，按(路径, 修改时间)缓存；日期索引和数据类型直接从文件恢复"""
+    data = pd.read_parquet(file_path)
+    # 与CSV路径保持一致，统一为UTC时区
+    if data.index.tz is None:
+        data.index = data.index.tz_localize('UTC')
+    else:
+        data.index = data.index.tz_convert('UTC')
+    data.attrs['source'] = (file_path, mtime_ns)
+    return data
+
+def read_data_parquet(file_path):
+    """读取parquet数据文件，返回缓存结果的副本"""
+    return _parse_data_parquet(file_path, os.stat(file_path).st_mtime_ns).copy()
+
+# get_symbol_data的短期结果缓存：(标的, 时间段, 日期) -> (缓存时间, DataFrame)
+SYMBOL_DATA_TTL = 60
+_symbol_data_cache = {}
+
 def get_symbol_data(symbol, period="1y"):
+    """获取标的数据，60秒内的重复请求直接返回缓存结果的副本"""
+    key = (symbol, period, datetime.now().strftime('%Y%m%d'))
+    entry = _symbol_data_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < SYMBOL_DATA_TTL:
+        return entry[1].copy()
+    
+    data = load_symbol_data(symbol, period)
+    if not data.empty:
+        # 顺便清理过期的缓存项
+        now = time.monotonic()
+        for old_key in [k for k, (ts, _) in list(_symbol_data_cache.items()) if now - ts >= SYMBOL_DATA_TTL]:
+            _symbol_data_cache.pop(old_key, None)
+        _symbol_data_cache[key] = (now, data.copy())
+    return data
+
+def load_symbol_data(symbol, period="1y"):
     """获取标的数据，优先使用本地修复后的数据文件"""
     today = datetime.now().strftime('%Y%m%d')
     yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y%m%d')
     
+    # 目录列表只在目录变化时重新扫描，下面的存在性检查都是集合查找
+    data_files = list_data_dir()
+    
     # 尝试加载数据，优先查找今天的数据，然后是昨天的，最后尝试其他日期
     for date_str in [today, yesterday]:
         # 1. 首先尝试加载已修复的文件（带有_fixed后缀）
         fixed_filename = f"{symbol}_{date_str}_fixed.csv"
         fixed_file_path = os.path.join(DATA_DIR, fixed_filename)
         
-        if os.path.exists(fixed_file_path):
+        if fixed_filename in data_files:
             try:
                 logger.info(f"正在加载已修复的文件: {fixed_filename}")
-                data = pd.read_csv(fixed_file_path)
-                if 'Date' in data.columns:
-                    data['Date'] = pd.to_datetime(data['Date'], utc=True)
-                    data.set_index('Date', inplace=True)
+                data = read_data_csv(fixed_file_path)
+                if data is not None:
                     return data
             except Exception as e:
                 logger.error(f"读取修复文件出错: {str(e)}")
                 
-        # 2. 尝试直接读取原始文件
+        # 2. 尝试加载下载时保存的parquet文件
+        parquet_filename = f"{symbol}_{date_str}.parquet"
+        
+        if PARQUET_AVAILABLE and parquet_filename in data_files:
+            try:
+                logger.info(f"正在加载parquet文件: {parquet_filename}")
+                return read_data_parquet(os.path.join(DATA_DIR, parquet_filename))
+            except Exception as e:
+                logger.error(f"读取parquet文件出错: {str(e)}")
+        
+        # 3. 尝试直接读取原始文件
         orig_filename = f"{symbol}_{date_str}.csv"
         orig_file_path = os.path.join(DATA_DIR, orig_filename)
         
-        if os.path.exists(orig_file_path):
+        if orig_filename in data_files:
             try:
                 logger.info(f"正在加载原始文件: {orig_filename}")
                 # 尝试跳过可能的标题行
-                data = pd.read_csv(orig_file_path, skiprows=[1, 2] if check_has_ticker_row(orig_file_path) else None)
-                if 'Date' in data.columns:
-                    data['Date'] = pd.to_datetime(data['Date'], utc=True)
-                    data.set_index('Date', inplace=True)
+                data = read_data_csv(orig_file_path, skip_ticker_rows=check_has_ticker_row(orig_file_path))
+                if data is not None:
                     return data
             except Exception as e:
                 logger.error(f"读取原始文件出错: {str(e)}")
     
-    # 3. 找不到今天或昨天的数据，尝试查找任何可用的最新数据文件
-    pattern = f"{symbol}_*_fixed.csv"
-    fixed_files = glob.glob(os.path.join(DATA_DIR, pattern))
+    # 4. 找不到今天或昨天的数据，尝试查找任何可用的最新数据文件
+    latest_fixed = latest_fixed_filename(symbol, data_files)
     
-    if fixed_files:
-        # 按文件名排序，通常最新的文件会排在最后
-        fixed_files.sort(reverse=True)
+    if latest_fixed:
         try:
-            logger.info(f"尝试加载最新的修复文件: {os.path.basename(fixed_files[0])}")
-            data = pd.read_csv(fixed_files[0])
-            if 'Date' in data.columns:
-                data['Date'] = pd.to_datetime(data['Date'], utc=True)
-                data.set_index('Date', inplace=True)
+            logger.info(f"尝试加载最新的修复文件: {latest_fixed}")
+            data = read_data_csv(os.path.join(DATA_DIR, latest_fixed))
+            if data is not None:
                 return data
         except Exception as e:
             logger.error(f"读取最新修复文件出错: {str(e)}")
     
-    # 4. 最后尝试从网络获取数据
+    # 5. 最后尝试从网络获取数据
     try:
-        logger.info(f"从网络下载数据: {symbol}")
-        data = yf.download(symbol, period=period)
-        # 保存到本地以供将来使用
-        out_file = os.path.join(DATA_DIR, f"{symbol}_{today}.csv")
-        data.reset_index().to_csv(out_file, index=False)
-        return data
+        return download_symbol_data(symbol, period, today)
     except Exception as e:
         logger.error(f"下载数据失败: {str(e)}")
         # 返回空的数据框
         return pd.DataFrame()
 
+# 当天已下载的数据缓存，按(标的, 时间段, 日期)索引，避免保存失败时重复下载
+_download_cache = {}
+# yf.download把结果收集在模块全局的shared._DFS中，并发调用会拿到其他标的的数据，必须串行下载
+_yf_download_lock = threading.Lock()
+
+def download_symbol_data(symbol, period, date_str):
+    """从网络下载数据并以原子方式保存到本地，同一天内重复请求直接使用缓存"""
+    key = (symbol, period, date_str)
+    if key in _download_cache:
+        return _download_cache[key].copy()
+    
+    logger.info(f"从网络下载数据: {symbol}")
+    with _yf_download_lock:
+        data = yf.download(symbol, period=period)
+    if data.empty:
+        return data
+    
+    # 只保留当天的缓存（先取键的快照，市场概览的其他线程可能同时写入）
+    for old_key in [k for k in list(_download_cache) if k[2] != date_str]:
+        _download_cache.pop(old_key, None)
+    _download_cache[key] = data
+    
+    # 保存到本地以供将来使用：先写临时文件再替换，中途失败不会留下不完整的文件
+    tmp_path = None
+    try:
+        if PARQUET_AVAILABLE:
+            # parquet保留日期索引和数据类型，读取时不需要重新解析；列名需要是字符串
+            out_file = os.path.join(DATA_DIR, f"{symbol}_{date_str}.parquet")
+            to_save = data.copy(deep=False)
+            if isinstance(to_save.columns, pd.MultiIndex):
+                to_save.columns = to_save.columns.get_level_values(0)
+            to_save.index.name = 'Date'
+            with tempfile.NamedTemporaryFile('wb', dir=DATA_DIR, suffix='.tmp', delete=False) as tmp:
+                tmp_path = tmp.name
+                to_save.to_parquet(tmp)
+        else:
+            out_file = os.path.join(DATA_DIR, f"{symbol}_{date_str}.csv")
+            with tempfile.NamedTemporaryFile('w', dir=DATA_DIR, suffix='.tmp', delete=False, newline='') as tmp:
+                tmp_path = tmp.name
+                data.reset_index().to_csv(tmp, index=False)
+        os.replace(tmp_path, out_file)
+    except Exception as e:
+        logger.warning(f"保存下载数据失败: {str(e)}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    return data.copy()
+
+def coerce_numeric_columns(df):
+    """
+    将除Date以外的非数值列一次性转换为数值类型，无法转换的值设为NaN
+    已经是数值类型的列保持不变，不再逐列转换
+    """
+    columns = [col for col, dtype in df.dtypes.items()
+               if col != 'Date' and not pd.api.types.is_numeric_dtype(dtype)]
+    if columns:
+        try:
+            df[columns] = df[columns].apply(pd.to_numeric, errors='coerce')
+        except Exception as e:
+            logger.warning(f"无法将列 {columns} 转换为数值: {str(e)}")
+    return df
+
+# 图表和报告计算指标前必须有值的价格列
+ESSENTIAL_COLUMNS = ('Open', 'High', 'Low', 'Close')
+
+# calculate_indicators的结果缓存：((数据文件, 修改时间), 参数集) -> DataFrame
+INDICATOR_CACHE_SIZE = 32
+_indicator_cache = {}
+_indicator_cache_lock = threading.Lock()
+
+def calculate_indicators_cached(data, parameter_set):
+    """
+    计算指标，数据来自本地文件时按(文件路径, 修改时间, 参数集)缓存结果
+    文件被替换后修改时间随之变化，旧结果不会再被命中；下载得到的数据没有来源信息，不缓存
+    调用方需要对数据做相同的预处理（coerce_numeric_columns并删除基本列缺失的行）
+    返回副本，调用方可以随意修改
+    """
+    source = data.attrs.get('source')
+    if source is None:
+        return calculate_indicators(data, parameter_set=parameter_set)
+    
+    key = (source, parameter_set)
+    with _indicator_cache_lock:
+        cached = _indicator_cache.get(key)
+    if cached is not None:
+        return cached.copy()
+    
+    result = calculate_indicators(data, parameter_set=parameter_set)
+    with _indicator_cache_lock:
+        # 超出容量时淘汰最早加入的结果
+        if len(_indicator_cache) >= INDICATOR_CACHE_SIZE:
+            _indicator_cache.pop(next(iter(_indicator_cache)))
+        _indicator_cache[key] = result
+    return result.copy()
+
+# check_has_ticker_row的结果缓存，按(文件路径, 修改时间)索引
+_ticker_row_cache = {}
+
 def check_has_ticker_row(file_path):
-    """检查CSV文件是否包含Ticker行"""
+    """检查CSV文件是否包含Ticker行（只读取前5行）"""
     try:
+        key = (file_path, os.stat(file_path).st_mtime_ns)
+        if key in _ticker_row_cache:
+            return _ticker_row_cache[key]
+        
         with open(file_path, 'r') as f:
-            lines = [next(f) for _ in range(min(5, sum(1 for _ in open(file_path))))]
-            return any('Ticker' in line for line in lines)
+            has_ticker = any('Ticker' in line for line in itertools.islice(f, 5))
+        
+        _ticker_row_cache[key] = has_ticker
+        return has_ticker
     except Exception:
         return False
 
-def format_indicator_data(df):
+def format_date_column(column):
     """
-    将指标数据格式化为JSON响应
-    - 确保日期格式正确
-    - 处理缺失值和特殊值
-    - 格式化数据为前端所需的格式
+    将日期列格式化为YYYY-MM-DD字符串，无法解析的值为None
+    整列一次转换为datetime64[D]，不逐行调用strftime
+    """
+    # 已经是日期时间类型时不再重复解析
+    if not pd.api.types.is_datetime64_any_dtype(column):
+        column = pd.to_datetime(column, errors='coerce')
+    dates = pd.DatetimeIndex(column)
+    # 带时区时保留当地时间的日期，与strftime的结果一致
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+    strings = np.datetime_as_string(dates.values.astype('datetime64[D]'), unit='D')
+    return np.where(dates.isna(), None, strings)
+
+def prepare_indicator_frame(df):
+    """
+    将日期索引转换为格式化的Date列，并把无穷大替换为NaN
     """
     # 存储索引名称以便重置前使用
     index_name = df.index.name if df.index.name else 'Date'
@@ -150,10 +492,8 @@ def format_indicator_data(df):
     
     # 确保由索引派生的列是日期时间类型
     if index_name in df.columns:
-        # 转换为日期时间以防它不是日期时间格式
-        df[index_name] = pd.to_datetime(df[index_name], errors='coerce') 
         # 将日期时间列格式化为字符串，处理coerce可能产生的NaT
-        df[index_name] = df[index_name].dt.strftime('%Y-%m-%d')
+        df[index_name] = format_date_column(df[index_name])
         # 如果列名不是'Date'，为保持一致性重命名为'Date'
         if index_name != 'Date':
             df.rename(columns={index_name: 'Date'}, inplace=True)
@@ -164,34 +504,39 @@ def format_indicator_data(df):
         if 'Date' not in df.columns:
             date_col = next((col for col in df.columns if 'date' in col.lower()), None)
             if date_col:
-                df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
-                df[date_col] = df[date_col].dt.strftime('%Y-%m-%d')
+                df[date_col] = format_date_column(df[date_col])
                 df.rename(columns={date_col: 'Date'}, inplace=True)
     
     # 处理无穷大、NaN和None等特殊值
     df.replace([np.inf, -np.inf], np.nan, inplace=True)
     
-    # 格式化为对象列表，每个对象包含日期和值
-    result = df.to_dict(orient='records')
+    return df
+
+def format_indicator_data(df):
+    """
+    将指标数据格式化为JSON响应
+    - 确保日期格式正确
+    - 处理缺失值和特殊值
+    - 格式化数据为前端所需的格式
+    """
+    df = prepare_indicator_frame(df)
     
-    # 替换所有NaN值为None（对JSON序列化更友好）
-    for record in result:
-        for key, value in record.items():
-            if pd.isna(value):
-                record[key] = None
+    # 一次性把所有NaN值替换为None（对JSON序列化更友好）
+    df = df.astype(object).where(df.notna(), None)
     
-    return result
+    # 格式化为对象列表，每个对象包含日期和值
+    return df.to_dict(orient='records')
 
 # API Routes
 @app.route('/api/assets', methods=['GET'])
 def get_assets():
     """Return list of available assets"""
-    return jsonify(AVAILABLE_ASSETS)
+    return json_response(ASSETS_JSON)
 
 @app.route('/api/parameters', methods=['GET'])
 def get_parameters():
     """Return list of available parameter sets"""
-    return jsonify(PARAMETER_SETS)
+    return json_response(PARAMETERS_JSON)
 
 @app.route('/api/data/<symbol>', methods=['GET'])
 def get_data(symbol):
@@ -227,7 +572,7 @@ def get_indicators(symbol):
     interval = request.args.get('interval', '1d')
     
     if parameter_set not in PARAMETER_SETS:
-        return jsonify({'error': f'Invalid parameter set. Choose from: {", ".join(PARAMETER_SETS)}'}), 400
+        return jsonify({'error': f'Invalid parameter set. Choose from: {PARAMETER_SETS_TEXT}'}), 400
     
     try:
         # Get data for the symbol
@@ -268,7 +613,7 @@ def generate_charts(symbol):
         parts = symbol.split('_')
         potential_symbol = parts[0]
         # Check if the first part is a valid symbol
-        if potential_symbol in ['EURUSD', 'GBPUSD', 'USDJPY', 'AUDUSD', 'USDCAD', 'GOLD', 'SILVER', 'OIL', 'S&P500', 'NASDAQ', 'DOW']:
+        if potential_symbol in VALID_SYMBOLS:
             symbol = potential_symbol
             logger.info(f"Extracted symbol {symbol} from filename pattern")
         else:
@@ -277,7 +622,7 @@ def generate_charts(symbol):
     # Validate parameter sets
     for ps in parameter_sets:
         if ps not in PARAMETER_SETS:
-            return jsonify({'error': f'Invalid parameter set: {ps}. Choose from: {", ".join(PARAMETER_SETS)}'}), 400
+            return jsonify({'error': f'Invalid parameter set: {ps}. Choose from: {PARAMETER_SETS_TEXT}'}), 400
     
     try:
         # Get data for the symbol
@@ -298,32 +643,28 @@ def generate_charts(symbol):
         except Exception as chart_error:
             # 如果调用generate_parameter_set_charts失败，我们回退到简单图表生成
             print(f"Error in generate_parameter_set_charts: {chart_error}")
-            import traceback
             traceback.print_exc()
             
             # 生成基本图表作为后备
             try:
-                # 手动创建简单的价格图表
-                import matplotlib.pyplot as plt
-                
                 # 确保目录存在
                 os.makedirs(CHARTS_DIR, exist_ok=True)
                 
-                # 创建一个简单的价格图表
-                plt.figure(figsize=(10, 6))
-                plt.plot(data.index, data['Close'], 'b-', label=f'{symbol} Price')
-                plt.title(f"{symbol} Price Chart (Fallback)")
-                plt.grid(True)
-                plt.legend()
+                # 创建一个简单的Plotly价格图表（布局在导入时已创建，不需要matplotlib渲染）
+                fig = go.Figure(
+                    data=[go.Scatter(x=data.index, y=data['Close'], mode='lines', name=f'{symbol} Price')],
+                    layout=FALLBACK_CHART_LAYOUT
+                )
+                fig.update_layout(title=f"{symbol} Price Chart (Fallback)")
                 
                 # 保存图表
                 today = datetime.now().strftime("%Y%m%d")
-                fallback_path = os.path.join(CHARTS_DIR, f"{symbol}_basic_{today}.png")
-                plt.savefig(fallback_path)
-                plt.close()
+                fallback_path = os.path.join(CHARTS_DIR, f"{symbol}_basic_{today}.html")
+                fig.write_html(fallback_path, include_plotlyjs='cdn')
                 
+                # 保存文件路径，下面统一转换为/charts/ URL
                 chart_files = {
-                    'indicators': [f"/charts/{os.path.basename(fallback_path)}"],
+                    'indicators': [fallback_path],
                     'bollinger': [],
                     'interactive': []
                 }
@@ -371,66 +712,54 @@ def generate_charts(symbol):
 @app.route('/api/optimal_indicators/<asset_type>', methods=['GET'])
 def get_optimal_indicators(asset_type):
     """Get optimal indicator set for an asset type"""
-    asset_indicators = {
-        'forex': ['SMA(50,200)', 'Bollinger Bands(20)', 'MACD(12,26)', 'RSI(14)'],
-        'commodities': ['SMA(200)', 'Bollinger Bands(50)', 'ATR(14)', 'Ichimoku'],
-        'indices': ['EMA(9,21)', 'Bollinger Bands(20)', 'MACD(12,26)', 'Volume Profile']
-    }
-    
-    if asset_type in asset_indicators:
-        return jsonify(asset_indicators[asset_type])
-    else:
-        return jsonify(['SMA(50)', 'Bollinger Bands(20)', 'RSI(14)'])
+    return json_response(OPTIMAL_INDICATORS_JSON.get(asset_type, DEFAULT_OPTIMAL_INDICATORS_JSON))
 
 @app.route('/api/market_summary', methods=['GET'])
 def get_market_summary():
     """
     获取市场概览数据，返回实时的市场数据用于仪表盘展示
     """
+    # 市场概览最多每分钟变化一次，优先返回缓存
+    cached = cache_get('market_summary')
+    if cached is not None:
+        return jsonify(cached)
+    
     market_data = []
     
     try:
-        # 获取主要市场资产的最新数据
-        key_assets = {
-            'forex': ['EURUSD'],
-            'commodities': ['GOLD', 'OIL'], 
-            'indices': ['S&P500', 'NASDAQ']
-        }
+        # 并行获取主要市场资产的最新数据和前一天数据（本地文件并行读取，网络下载在download_symbol_data中串行执行）
+        # 获取近5天数据以确保有上一个交易日数据
+        with ThreadPoolExecutor(max_workers=len(MARKET_SUMMARY_SYMBOLS)) as executor:
+            data_map = dict(zip(MARKET_SUMMARY_SYMBOLS, executor.map(lambda s: get_symbol_data(s, period="5d"), MARKET_SUMMARY_SYMBOLS)))
         
-        for category, assets in key_assets.items():
-            for symbol in assets:
-                # 获取该资产的最新数据和前一天数据
-                data = get_symbol_data(symbol, period="5d")  # 获取近5天数据以确保有上一个交易日数据
-                
-                if data.empty:
-                    logger.warning(f"无法获取 {symbol} 的数据")
-                    continue
-                    
-                # 获取最新价格
-                latest_date = data.index.max()
-                previous_date = data.index[-2] if len(data.index) > 1 else None
-                
-                if previous_date is None:
-                    logger.warning(f"无法获取 {symbol} 的前一天数据")
-                    continue
-                
-                last_price = data.loc[latest_date, 'Close']
-                previous_price = data.loc[previous_date, 'Close']
-                
-                # 计算变动
-                change = last_price - previous_price
-                change_percent = (change / previous_price) * 100 if previous_price > 0 else 0
-                trend = 'up' if change >= 0 else 'down'
-                
-                # 添加到结果中
-                market_data.append({
-                    'asset': symbol,
-                    'lastPrice': float(last_price),
-                    'change': float(change),
-                    'changePercent': float(change_percent),
-                    'trend': trend
-                })
+        for symbol, data in data_map.items():
+            if data.empty:
+                logger.warning(f"无法获取 {symbol} 的数据")
+                continue
                 
+            # 获取最新价格（按位置取最后两个收盘价）
+            closes = data['Close'].to_numpy()
+            if closes.size < 2:
+                logger.warning(f"无法获取 {symbol} 的前一天数据")
+                continue
+            
+            last_price, previous_price = float(closes[-1]), float(closes[-2])
+            
+            # 计算变动
+            change = last_price - previous_price
+            change_percent = (change / previous_price) * 100 if previous_price > 0 else 0
+            trend = 'up' if change >= 0 else 'down'
+            
+            # 添加到结果中
+            market_data.append({
+                'asset': symbol,
+                'lastPrice': float(last_price),
+                'change': float(change),
+                'changePercent': float(change_percent),
+                'trend': trend
+            })
+        
+        cache_set('market_summary', market_data, 60)
         return jsonify(market_data)
     except Exception as e:
         logger.error(f"获取市场概览数据出错: {str(e)}")
@@ -456,7 +785,7 @@ def get_chart_data(symbol):
     period = request.args.get('period', '1y')
     
     if parameter_set not in PARAMETER_SETS:
-        return jsonify({'error': f'无效的参数集: {parameter_set}。请从以下选择: {", ".join(PARAMETER_SETS)}'}), 400
+        return jsonify({'error': f'无效的参数集: {parameter_set}。请从以下选择: {PARAMETER_SETS_TEXT}'}), 400
         
     try:
         # 获取原始价格数据
@@ -469,64 +798,37 @@ def get_chart_data(symbol):
         logger.info(f"Data types: {price_data.dtypes}")
         
         # 确保所有数值列正确转换为浮点型
-        for col in price_data.columns:
-            # 跳过日期列（如果存在）
-            if col in ['Date']:
-                continue
-                
-            # 尝试转换为数值，强制错误为NaN
-            try:
-                price_data[col] = pd.to_numeric(price_data[col], errors='coerce')
-            except Exception as e:
-                logger.warning(f"无法将列 {col} 转换为数值: {str(e)}")
+        price_data = coerce_numeric_columns(price_data)
         
         # 转换后再次检查
         logger.info(f"Data types after conversion: {price_data.dtypes}")
         
-        # 删除基本列中包含NaN的行
-        essential_columns = ['Open', 'High', 'Low', 'Close']
-        for col in essential_columns:
-            if col in price_data.columns:
-                price_data = price_data.dropna(subset=[col])
+        # 删除基本列中包含NaN的行（一次过滤）
+        price_data = price_data.dropna(subset=[col for col in ESSENTIAL_COLUMNS if col in price_data.columns])
         
-        # 计算指标
+        # 计算指标（返回价格列加指标列；源数据文件未变化时直接使用缓存结果）
         try:
-            indicator_data = calculate_indicators(price_data.copy(), parameter_set=parameter_set)
+            combined_data = calculate_indicators_cached(price_data, parameter_set)
         except Exception as e:
             logger.error(f"计算指标时出错: {str(e)}")
-            import traceback
             traceback.print_exc()
             # 如果指标计算失败，返回原始价格数据
-            indicator_data = price_data
-        
-        # 合并数据时只保留一组字段，避免_x/_y后缀
-        combined_data = price_data.copy()
-        for col in indicator_data.columns:
-            if col not in price_data.columns or col in ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']:
-                continue
-            combined_data[col] = indicator_data[col]
+            combined_data = price_data
 
         # 替换特殊值为NaN，以便在JSON响应中正确处理
         combined_data.replace([pd.NA, None, float('inf'), float('-inf')], np.nan, inplace=True)
         
-        # 将数据格式化为JSON响应
-        formatted_data = format_indicator_data(combined_data)
+        logger.info(f"Chart data length for {symbol}: {len(combined_data)}")
         
-        logger.info(f"Formatted data length for {symbol}: {len(formatted_data)}")
-        if len(formatted_data) > 0:
-            logger.info(f"First record for {symbol}: {formatted_data[0]}")
-            if len(formatted_data) > 1:
-                logger.info(f"Last record for {symbol}: {formatted_data[-1]}")
-
+        # 与其他接口一样通过jsonify一次性序列化（安装了orjson时使用orjson），响应带Content-Length
         return jsonify({
-            'symbol': symbol,
+            'data': format_indicator_data(combined_data),
             'parameter_set': parameter_set,
-            'data': formatted_data
+            'symbol': symbol
         })
         
     except Exception as e:
         logger.error(f"Error getting chart data for {symbol}: {str(e)}")
-        import traceback
         traceback.print_exc()
         return jsonify({'error': f'An error occurred while processing chart data: {str(e)}'}), 500
 
@@ -547,11 +849,11 @@ def generate_report(symbol):
     
     # Extract actual symbol if needed (same as in generate_charts)
     actual_symbol = symbol.split('_')[0]
-    if actual_symbol in ['EURUSD', 'GBPUSD', 'USDJPY', 'AUDUSD', 'USDCAD', 'GOLD', 'SILVER', 'OIL', 'S&P500', 'NASDAQ', 'DOW']:
+    if actual_symbol in VALID_SYMBOLS:
         symbol = actual_symbol
     
     if parameter_set not in PARAMETER_SETS:
-        return jsonify({'error': f'Invalid parameter set. Choose from: {", ".join(PARAMETER_SETS)}'}), 400
+        return jsonify({'error': f'Invalid parameter set. Choose from: {PARAMETER_SETS_TEXT}'}), 400
     
     try:
         # Get data for the symbol
@@ -564,28 +866,13 @@ def generate_report(symbol):
         logger.info(f"Report data types: {data.dtypes}")
         
         # Ensure all numeric columns are properly converted to float
-        for col in data.columns:
-            # Skip Date column if it exists
-            if col in ['Date']:
-                continue
-                
-            # Try to convert to numeric, coerce errors to NaN
-            try:
-                data[col] = pd.to_numeric(data[col], errors='coerce')
-            except Exception as e:
-                logger.warning(f"Could not convert column {col} to numeric: {str(e)}")
+        data = coerce_numeric_columns(data)
         
-        # Drop any rows with NaN in essential columns
-        essential_columns = ['Open', 'High', 'Low', 'Close']
-        for col in essential_columns:
-            if col in data.columns:
-                data = data.dropna(subset=[col])
+        # Drop any rows with NaN in essential columns, in a single pass
+        data = data.dropna(subset=[col for col in ESSENTIAL_COLUMNS if col in data.columns])
                 
-        # Calculate indicators
-        indicator_data = calculate_indicators(data.copy(), parameter_set=parameter_set)
-        
-        # Import the report generation function
-        from generate_html_report import generate_interactive_report
+        # Calculate indicators, reusing the result while the source data file is unchanged
+        indicator_data = calculate_indicators_cached(data, parameter_set)
         
         # Generate the report
         current_date = datetime.now().strftime("%Y%m%d")
@@ -602,6 +889,8 @@ def generate_report(symbol):
                 language=language,
                 standalone=standalone
             )
+            # Regenerating an existing report does not change the directory mtime
+            _invalidate_reports_cache()
             
             # Return the report URL
             return jsonify({
@@ -611,16 +900,76 @@ def generate_report(symbol):
             })
         except Exception as report_error:
             logger.error(f"Error generating report: {str(report_error)}")
-            import traceback
             traceback.print_exc()
             return jsonify({'error': f'Failed to generate report: {str(report_error)}'}), 500
         
     except Exception as e:
         logger.error(f"Error processing data for report: {str(e)}")
-        import traceback
         traceback.print_exc()
         return jsonify({'error': f'An error occurred: {str(e)}'}), 500
 
+# Parsed report listing, keyed on the Reports directory mtime
+_reports_cache = {'mtime': None, 'data': None}
+
+# Interactive report filename: SYMBOL_interactive_report_YYYYMMDD_PARAMETER_SET.html
+REPORT_FILENAME_RE = re.compile(r'^(?P<symbol>[^_]+)_interactive_report_(?P<date>\d{8})_(?P<parameter_set>.+)\.html$')
+
+def _is_date_part(part):
+    """Check for a YYYYMMDD filename part by slicing instead of datetime.strptime"""
+    if len(part) != 8 or not part.isdigit():
+        return False
+    month = int(part[4:6])
+    day = int(part[6:8])
+    return 1 <= month <= 12 and 1 <= day <= 31
+
+def _scan_reports():
+    """
+    Return report information for all interactive reports, newest first.
+    The directory scan is cached until the Reports directory changes.
+    """
+    mtime = os.stat(REPORTS_DIR).st_mtime_ns
+    if _reports_cache['mtime'] == mtime and _reports_cache['data'] is not None:
+        return _reports_cache['data']
+    
+    entries = []
+    with os.scandir(REPORTS_DIR) as it:
+        for entry in it:
+            filename = entry.name
+            
+            # Parse the filename to extract symbol, date and parameter set
+            # Expected format: SYMBOL_interactive_report_YYYYMMDD_PARAMETER_SET.html
+            match = REPORT_FILENAME_RE.match(filename)
+            if not match:
+                continue
+            symbol = match['symbol']
+            date_part = match['date'] if _is_date_part(match['date']) else None
+            
+            # Format date for display (YYYYMMDD to YYYY-MM-DD)
+            formatted_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]}" if date_part else ""
+            
+            # Parameter set follows the date and may itself contain underscores
+            parameter_set = match['parameter_set']
+            
+            entries.append((entry.stat().st_mtime, {
+                'symbol': symbol,
+                'date': formatted_date,
+                'parameterSet': parameter_set,
+                'filename': filename,
+                'url': f"/reports/{filename}"
+            }))
+    
+    # Sort by modification time (newest first)
+    entries.sort(key=lambda item: item[0], reverse=True)
+    reports = [report for _, report in entries]
+    
+    _reports_cache['mtime'] = mtime
+    _reports_cache['data'] = reports
+    return reports
+
+def _invalidate_reports_cache():
+    """Force the next report listing to rescan the Reports directory"""
+    _reports_cache['mtime'] = None
+
 @app.route('/api/recent_reports', methods=['GET'])
 def get_recent_reports():
     """
@@ -631,56 +980,17 @@ def get_recent_reports():
     limit = int(request.args.get('limit', 5))
     
     try:
-        # Get all report files in the reports directory
-        report_files = glob.glob(os.path.join(REPORTS_DIR, '*_interactive_report_*.html'))
-        
-        # Sort by modification time (newest first)
-        report_files.sort(key=os.path.getmtime, reverse=True)
-        
-        # Limit the number of files
-        report_files = report_files[:limit]
-        
-        # Format report information
-        reports = []
-        for file_path in report_files:
-            filename = os.path.basename(file_path)
-            
-            # Parse the filename to extract symbol, date and parameter set
-            # Expected format: SYMBOL_interactive_report_YYYYMMDD_PARAMETER_SET.html
-            parts = filename.split('_')
-            if len(parts) >= 5 and 'interactive_report' in filename:
-                symbol = parts[0]
-                
-                # Extract date - should be the first 8-digit sequence
-                date_part = None
-                for part in parts:
-                    if part.isdigit() and len(part) == 8:
-                        date_part = part
-                        break
-                
-                # Format date for display (YYYYMMDD to YYYY-MM-DD)
-                formatted_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]}" if date_part else ""
-                
-                # Extract parameter set (usually comes after the date)
-                parameter_set = parts[-1].replace('.html', '')
-                
-                reports.append({
-                    'symbol': symbol,
-                    'date': formatted_date,
-                    'parameterSet': parameter_set,
-                    'filename': filename,
-                    'url': f"/reports/{filename}"
-                })
-        
-        return jsonify(reports)
+        reports = _scan_reports()
+        return jsonify(reports[:limit])
     except Exception as e:
         logger.error(f"Error fetching recent reports: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api', methods=['GET'])
-def api_index():
-    """API welcome page with available endpoints"""
-    endpoints = {
+# API welcome page content
+API_INDEX = {
+    'name': 'Financial Analysis Platform API',
+    'version': '1.0',
+    'endpoints': {
         'GET /api/assets': 'List of available assets by category',
         'GET /api/parameters': 'Available parameter sets for indicator calculation',
         'GET /api/data/<symbol>': 'Raw price data for a symbol',
@@ -692,42 +1002,74 @@ def api_index():
         'GET /api/recent_reports': 'Get a list of recently generated reports',
         'GET /charts/<filename>': 'Serve chart files',
         'GET /reports/<filename>': 'Serve report files'
-    }
+    },
+    'usage': 'See documentation for detailed usage information'
+}
+API_INDEX_JSON = app.json.dumps(API_INDEX)
+
+@app.route('/api', methods=['GET'])
+def api_index():
+    """API welcome page with available endpoints"""
+    return json_response(API_INDEX_JSON)
+
+# Chart and report filenames carry their generation date (YYYYMMDD), optionally
+# followed by the parameter set, e.g. EURUSD_interactive_report_20250501_default.html
+DATED_FILENAME_RE = re.compile(r'_(\d{8})(?:_[A-Za-z0-9_]+)?\.(?:html|png)$')
+
+def cache_control_for(filename):
+    """
+    Files dated before today are cached for a day and then revalidated, since
+    regenerate_reports.py can rewrite them (the conditional responses make that a 304);
+    today's files may still be regenerated, so they only get a short max-age
+    """
+    match = DATED_FILENAME_RE.search(filename)
+    if match and match.group(1) < datetime.now().strftime("%Y%m%d"):
+        return 'public, max-age=86400, must-revalidate'
+    return 'public, max-age=60'
+
+def send_data_file(directory, location, filename):
+    """
+    Send a chart or report file, handing the transfer to nginx through
+    X-Accel-Redirect when X_ACCEL_PREFIX is set
+    """
+    if not X_ACCEL_PREFIX:
+        response = send_from_directory(directory, filename, conditional=True)
+        # flask-compress跳过direct_passthrough的文件响应；较小的HTML允许其压缩（需要整体读入内存）
+        # X-Sendfile模式下响应体为空，由前端服务器发送文件，不能压缩
+        if (Compress is not None and not app.use_x_sendfile and response.status_code == 200
+                and response.mimetype == 'text/html'
+                and response.content_length is not None and response.content_length <= COMPRESS_MAX_FILE_SIZE):
+            response.direct_passthrough = False
+        return response
     
-    return jsonify({
-        'name': 'Financial Analysis Platform API',
-        'version': '1.0',
-        'endpoints': endpoints,
-        'usage': 'See documentation for detailed usage information'
-    })
+    file_path = safe_join(directory, filename)
+    if file_path is None or not os.path.isfile(file_path):
+        abort(404)
+    
+    response = make_response('')
+    response.mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    response.headers['X-Accel-Redirect'] = f"{X_ACCEL_PREFIX}/{location}/{filename}"
+    return response
 
 @app.route('/charts/<path:filename>')
 def serve_chart(filename):
     """Serve chart files"""
-    response = send_from_directory(CHARTS_DIR, filename)
+    response = send_data_file(CHARTS_DIR, 'charts', filename)
+    response.headers['Cache-Control'] = cache_control_for(filename)
     response.headers['Access-Control-Allow-Origin'] = '*'
     return response
 
 @app.route('/reports/<path:filename>')
 def serve_report(filename):
     """Serve report files"""
-    response = send_from_directory(REPORTS_DIR, filename)
+    response = send_data_file(REPORTS_DIR, 'reports', filename)
+    response.headers['Cache-Control'] = cache_control_for(filename)
     response.headers['Access-Control-Allow-Origin'] = '*'
     return response
 
-# Serve React frontend or a temporary welcome page
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
-def serve_react(path):
-    # Check if the React build folder exists
-    if os.path.exists(app.static_folder):
-        if path != "" and os.path.exists(os.path.join(app.static_folder, path)):
-            return send_from_directory(app.static_folder, path)
-        elif os.path.exists(os.path.join(app.static_folder, 'index.html')):
-            return send_from_directory(app.static_folder, 'index.html')
-    
-    # If build directory doesn't exist, show a temporary welcome page
-    welcome_html = f"""
+# Temporary welcome page shown until the React frontend is built; AVAILABLE_ASSETS is static,
+# so the page is rendered once at import
+WELCOME_HTML = f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -821,7 +1163,20 @@ def serve_react(path):
     </body>
     </html>
     """
-    return welcome_html
+
+# Serve React frontend or a temporary welcome page
+@app.route('/', defaults={'path': ''})
+@app.route('/<path:path>')
+def serve_react(path):
+    # Check if the React build folder exists
+    if os.path.exists(app.static_folder):
+        if path != "" and os.path.exists(os.path.join(app.static_folder, path)):
+            return send_from_directory(app.static_folder, path)
+        elif os.path.exists(os.path.join(app.static_folder, 'index.html')):
+            return send_from_directory(app.static_folder, 'index.html')
+    
+    # If build directory doesn't exist, show a temporary welcome page
+    return WELCOME_HTML
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for the Financial Analysis API
+
+Usage (from the project root):
+    gunicorn -c api/gunicorn.conf.py wsgi:app
+    GUNICORN_WORKERS=4 GUNICORN_THREADS=8 gunicorn -c api/gunicorn.conf.py wsgi:app
+"""
+
+import multiprocessing
+import os
+
+# Import the application from the api directory
+chdir = os.path.dirname(os.path.abspath(__file__))
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+# Threaded workers: yfinance downloads through curl_cffi and the indicator work is
+# pure pandas, neither of which cooperates with gevent greenlets
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Report and chart generation can take a while for long periods
+timeout = 120
+
+# Load the application once in the master so workers share it copy-on-write.
+# Greenlet workers monkey-patch at worker start, so the app must not be imported
+# before that; skip preloading for them
+preload_app = worker_class not in ('gevent', 'eventlet')
@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+"""
+WSGI Entry Point
+----------------
+Production entry point for the Flask backend API, see gunicorn.conf.py:
+
+    gunicorn -c api/gunicorn.conf.py wsgi:app
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5000)
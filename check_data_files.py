@@ -1,13 +1,30 @@
 import os
 import pandas as pd
-import glob
 
 # 数据目录
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Data")
 
+# 修复后的文件必须包含的列
+REQUIRED_COLUMNS = ('Date', 'Close', 'High', 'Low', 'Open')
+
+def count_data_rows(file_path):
+    """按1MB分块统计换行符得到数据行数（不含列名行），不解析文件内容"""
+    lines = 0
+    last = b'\n'
+    with open(file_path, 'rb') as f:
+        for buf in iter(lambda: f.read(1 << 20), b''):
+            lines += buf.count(b'\n')
+            last = buf[-1:]
+    # 最后一行没有换行符时也计入
+    if last != b'\n':
+        lines += 1
+    return max(lines - 1, 0)
+
 def check_fixed_files():
     """检查已修复的文件是否能正确加载"""
-    fixed_files = glob.glob(os.path.join(DATA_DIR, "*_fixed.csv"))
+    with os.scandir(DATA_DIR) as entries:
+        fixed_files = [entry.path for entry in entries
+                       if entry.name.endswith('_fixed.csv') and entry.is_file()]
     print(f"找到 {len(fixed_files)} 个已修复的数据文件")
     
     successful = 0
@@ -16,12 +33,12 @@ def check_fixed_files():
     for file_path in fixed_files:
         file_name = os.path.basename(file_path)
         try:
-            # 加载数据文件
-            df = pd.read_csv(file_path)
+            # 只读取必要列的前5行样本（其他列不解析），行数通过扫描换行符统计
+            df = pd.read_csv(file_path, nrows=5, usecols=lambda col: col in REQUIRED_COLUMNS)
+            row_count = count_data_rows(file_path)
             
             # 检查必要的列
-            required_columns = ['Date', 'Close', 'High', 'Low', 'Open']
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
             
             if missing_columns:
                 print(f"警告: {file_name} 缺少必要的列: {', '.join(missing_columns)}")
@@ -29,16 +46,16 @@ def check_fixed_files():
                 continue
             
             # 检查数据行数
-            if len(df) < 5:
-                print(f"警告: {file_name} 数据行数过少: {len(df)}")
+            if row_count < 5:
+                print(f"警告: {file_name} 数据行数过少: {row_count}")
                 failed += 1
                 continue
                 
-            # 转换日期列
-            df['Date'] = pd.to_datetime(df['Date'])
+            # 检查日期列能否解析，只抽查前5行
+            pd.to_datetime(df['Date'], errors='raise')
             
             # 一切正常
-            print(f"成功: {file_name} 可以正确加载，包含 {len(df)} 行数据")
+            print(f"成功: {file_name} 可以正确加载，包含 {row_count} 行数据")
             successful += 1
             
         except Exception as e:
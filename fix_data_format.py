@@ -10,14 +10,95 @@
 """
 
 import os
+import sys
+import csv
+import importlib.util
 import pandas as pd
-import glob
 import logging
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 
 # 设置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 安装了pyarrow时使用其多线程CSV解析器
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+def read_csv_fast(file_path, **kwargs):
+    """优先使用pyarrow引擎读取CSV，未安装或解析失败时退回默认的C引擎"""
+    if PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(file_path, engine='pyarrow', **kwargs)
+        except Exception:
+            pass
+    return pd.read_csv(file_path, **kwargs)
+
+def _fix_one(file_path):
+    """
+    修复单个数据文件，结果保存在同一目录下带_fixed后缀的文件中
+    返回(是否成功, 文件名)，在工作进程中执行
+    """
+    file_name = os.path.basename(file_path)
+    try:
+        logger.info(f"处理文件: {file_name}")
+        
+        # 读取原始CSV文件，跳过前几行头信息
+        try:
+            # 先读取文件前5行，查看结构
+            with open(file_path, 'r') as f:
+                header_lines = list(islice(f, 5))
+            
+            # 确定要跳过的行数
+            skip_rows = 0
+            if len(header_lines) > 1 and any("Ticker" in line for line in header_lines):
+                skip_rows = 2  # 跳过Ticker行和空Date行
+            
+            # 读取数据，跳过确定的行数
+            df = read_csv_fast(file_path, skiprows=skip_rows)
+            
+            # 检查是否包含必要的列
+            required_columns = ['Date', 'Close', 'High', 'Low', 'Open']
+            missing_columns = [col for col in required_columns if col not in df.columns]
+            
+            if missing_columns:
+                logger.warning(f"文件 {file_name} 缺少必要的列: {', '.join(missing_columns)}")
+                # 尝试从其他列名映射，收集后一次性重命名
+                rename_map = {}
+                if 'Date' in missing_columns and df.columns[0].lower() in ['date', 'time', 'datetime']:
+                    rename_map[df.columns[0]] = 'Date'
+                if 'Price' in df.columns and 'Close' in missing_columns:
+                    rename_map['Price'] = 'Close'
+                if rename_map:
+                    df.rename(columns=rename_map, inplace=True)
+            
+            # 确保Date列是日期格式
+            if 'Date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['Date']):
+                df['Date'] = pd.to_datetime(df['Date'])
+            
+            # 保存修复后的文件
+            fixed_file_path = os.path.join(os.path.dirname(file_path), file_name.replace('.csv', '_fixed.csv'))
+            # 数值数据不需要加引号，固定使用\n换行；读取端不处理转义符，含逗号等需要转义的字段直接写入失败
+            # 先写临时文件，写入失败时不会留下不完整的_fixed文件
+            tmp_file_path = fixed_file_path + '.tmp'
+            try:
+                df.to_csv(tmp_file_path, index=False, quoting=csv.QUOTE_NONE, lineterminator='\n')
+                os.replace(tmp_file_path, fixed_file_path)
+            finally:
+                if os.path.exists(tmp_file_path):
+                    os.remove(tmp_file_path)
+            
+            logger.info(f"成功修复文件: {file_name} -> {os.path.basename(fixed_file_path)}")
+            return True, file_name
+            
+        except Exception as e:
+            logger.error(f"无法读取或处理文件 {file_name}: {str(e)}")
+            return False, file_name
+            
+    except Exception as e:
+        logger.error(f"处理文件时出错: {str(e)}")
+        return False, file_name
+
 def fix_data_format(data_dir):
     """
     修复数据文件格式，使其符合应用程序的期望格式。
@@ -25,71 +106,34 @@ def fix_data_format(data_dir):
     1. 去除多余的头信息行（如Ticker行和空Date行）
     2. 确保Date列是日期格式并设置为索引
     3. 确保包含必要的OHLC列（Open, High, Low, Close）
+    各文件互不依赖，使用进程池并行处理
     """
-    # 获取所有CSV文件
-    csv_files = glob.glob(os.path.join(data_dir, "*.csv"))
-    
-    # 统计
-    total_files = len(csv_files)
-    fixed_files = 0
-    failed_files = 0
+    # 遍历一次目录获取所有CSV文件，同时跳过已经处理过的文件
+    total_files = 0
+    pending_files = []
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.csv') or not entry.is_file():
+                continue
+            total_files += 1
+            if "_fixed.csv" in entry.name:
+                logger.info(f"跳过已处理的文件: {entry.name}")
+            else:
+                pending_files.append(entry.path)
     
     logger.info(f"找到{total_files}个CSV文件需要处理")
     
-    for file_path in csv_files:
-        try:
-            file_name = os.path.basename(file_path)
-            # 跳过已经处理过的文件
-            if "_fixed.csv" in file_name:
-                logger.info(f"跳过已处理的文件: {file_name}")
-                continue
-                
-            logger.info(f"处理文件: {file_name}")
-            
-            # 读取原始CSV文件，跳过前几行头信息
-            try:
-                # 先尝试读取文件头，查看结构
-                with open(file_path, 'r') as f:
-                    header_lines = [next(f) for _ in range(min(5, sum(1 for _ in f)))]
-                
-                # 确定要跳过的行数
-                skip_rows = 0
-                if len(header_lines) > 1 and any("Ticker" in line for line in header_lines):
-                    skip_rows = 2  # 跳过Ticker行和空Date行
-                
-                # 读取数据，跳过确定的行数
-                df = pd.read_csv(file_path, skiprows=skip_rows)
-                
-                # 检查是否包含必要的列
-                required_columns = ['Date', 'Close', 'High', 'Low', 'Open']
-                missing_columns = [col for col in required_columns if col not in df.columns]
-                
-                if missing_columns:
-                    logger.warning(f"文件 {file_name} 缺少必要的列: {', '.join(missing_columns)}")
-                    # 尝试从其他列名映射
-                    if 'Date' in missing_columns and df.columns[0].lower() in ['date', 'time', 'datetime']:
-                        df.rename(columns={df.columns[0]: 'Date'}, inplace=True)
-                    if 'Price' in df.columns and 'Close' in missing_columns:
-                        df.rename(columns={'Price': 'Close'}, inplace=True)
-                
-                # 确保Date列是日期格式
-                if 'Date' in df.columns:
-                    df['Date'] = pd.to_datetime(df['Date'])
-                
-                # 保存修复后的文件
-                fixed_file_path = os.path.join(data_dir, file_name.replace('.csv', '_fixed.csv'))
-                df.to_csv(fixed_file_path, index=False)
-                
-                logger.info(f"成功修复文件: {file_name} -> {os.path.basename(fixed_file_path)}")
-                fixed_files += 1
-                
-            except Exception as e:
-                logger.error(f"无法读取或处理文件 {file_name}: {str(e)}")
-                failed_files += 1
-                
-        except Exception as e:
-            logger.error(f"处理文件时出错: {str(e)}")
-            failed_files += 1
+    results = []
+    if pending_files:
+        max_workers = min(len(pending_files), os.cpu_count() or 1)
+        # Windows上ProcessPoolExecutor最多支持61个工作进程
+        if sys.platform == 'win32':
+            max_workers = min(max_workers, 61)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_fix_one, pending_files))
+    
+    fixed_files = sum(1 for ok, _ in results if ok)
+    failed_files = len(results) - fixed_files
     
     logger.info(f"处理完成. 总文件数: {total_files}, 成功修复: {fixed_files}, 失败: {failed_files}")
     return fixed_files, failed_files
@@ -8,9 +8,12 @@ This script starts both the Flask backend and React frontend
 import os
 import sys
 import subprocess
-import threading
+import socket
 import time
 import shutil
+import functools
+import hashlib
+import importlib.metadata
 from pathlib import Path
 
 # Define paths
@@ -18,8 +21,21 @@ BASE_DIR = Path(__file__).parent.absolute()
 API_DIR = BASE_DIR / "api"
 WEB_DIR = BASE_DIR / "web"
 
+# Written once all required Python packages are found, see check_python_dependencies
+DEPS_MARKER = BASE_DIR / ".deps_checked"
+
+# Port the Flask development server in api/app.py listens on
+BACKEND_PORT = 5000
+
+# Starts api/app.py in debug mode with the reloader disabled, used by run_both
+BACKEND_NO_RELOAD_CODE = (
+    "from app import app; "
+    f"app.run(debug=True, use_reloader=False, host='0.0.0.0', port={BACKEND_PORT})"
+)
+
+@functools.lru_cache(maxsize=1)
 def check_node_installed():
-    """Check if Node.js is installed"""
+    """Check if Node.js is installed (probed once per run)"""
     try:
         npm_path = shutil.which("npm")
         if npm_path is None:
@@ -35,8 +51,9 @@ def check_node_installed():
     except Exception:
         return False
 
+@functools.lru_cache(maxsize=1)
 def check_local_node():
-    """Check if we have a local Node.js installation in the node directory"""
+    """Check if we have a local Node.js installation in the node directory (probed once per run)"""
     node_dir = BASE_DIR / "node"
     node_exe = node_dir / "node.exe"
     npm_cmd = node_dir / "npm.cmd"
@@ -59,21 +76,41 @@ def run_with_local_node(command, cwd=None):
     return subprocess.run(command, env=env, cwd=cwd)
 
 def check_python_dependencies():
-    """Check if required Python packages are installed"""
-    required_packages = ["flask", "flask_cors", "pandas", "plotly", "yfinance"]
+    """
+    Check if required Python packages are installed (reads package metadata only, nothing is imported)
+    
+    Once every package is present, a signature of the package list and interpreter is written to
+    DEPS_MARKER and later runs skip the check; delete the file to force a re-check
+    """
+    required_packages = ["flask", "flask-cors", "pandas", "plotly", "yfinance"]
+    signature = hashlib.sha1(repr((sys.executable, sorted(required_packages))).encode()).hexdigest()
+    try:
+        if DEPS_MARKER.read_text() == signature:
+            return True
+    except OSError:
+        pass
+    
     missing_packages = []
     
     for package in required_packages:
         try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
+            importlib.metadata.distribution(package)
+        except importlib.metadata.PackageNotFoundError:
             missing_packages.append(package)
     
     if missing_packages:
         print(f"\nInstalling missing Python packages: {', '.join(missing_packages)}")
-        subprocess.run([sys.executable, "-m", "pip", "install"] + missing_packages)
+        result = subprocess.run([sys.executable, "-m", "pip", "install"] + missing_packages)
+        if result.returncode != 0:
+            print("WARNING: Failed to install some Python packages.")
+            return True
         print("Required packages installed successfully.")
     
+    try:
+        DEPS_MARKER.write_text(signature)
+    except OSError:
+        pass
+    
     return True
 
 def run_backend():
@@ -89,8 +126,7 @@ def run_backend():
             return False
             
         print("Starting Flask backend server...")
-        os.chdir(API_DIR)
-        subprocess.run([sys.executable, "app.py"])
+        subprocess.run([sys.executable, "app.py"], cwd=API_DIR)
         return True
     except KeyboardInterrupt:
         print("\nBackend server stopped.")
@@ -131,25 +167,27 @@ def build_frontend():
         return False
         
     try:
-        # Check if web directory exists
-        if not WEB_DIR.exists():
+        # Check if web directory exists; the same listing tells whether node_modules is present
+        try:
+            with os.scandir(WEB_DIR) as entries:
+                web_entries = {entry.name for entry in entries}
+        except FileNotFoundError:
             print(f"\nERROR: Web directory not found at {WEB_DIR}")
             print("Please make sure the 'web' folder exists with the React application\n")
             return False
             
-        os.chdir(WEB_DIR)
-        if not (WEB_DIR / "node_modules").exists():
+        if "node_modules" not in web_entries:
             print("Installing frontend dependencies (this may take a while)...")
             if check_local_node():
                 run_with_local_node(["npm", "install"], cwd=WEB_DIR)
             else:
-                subprocess.run(["npm", "install"])
+                subprocess.run(["npm", "install"], cwd=WEB_DIR)
         
         print("Building frontend for production...")
         if check_local_node():
             run_with_local_node(["npm", "run", "build"], cwd=WEB_DIR)
         else:
-            subprocess.run(["npm", "run", "build"])
+            subprocess.run(["npm", "run", "build"], cwd=WEB_DIR)
         print("Frontend build complete. Files are in web/build directory.")
         
         # Copy build to API static folder
@@ -162,6 +200,19 @@ def build_frontend():
         print(f"\nERROR building frontend: {e}")
         return False
 
+def wait_for_port(port, timeout=10.0, process=None):
+    """Wait until a server accepts TCP connections on localhost:port, or the process exits"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return True
+        time.sleep(0.1)
+    return False
+
 def run_both():
     """Run both backend and frontend concurrently"""
     # Check Python dependencies
@@ -173,18 +224,28 @@ def run_both():
         run_backend()
         return
     
-    # Start backend in a separate thread
-    backend_thread = threading.Thread(target=run_backend)
-    backend_thread.daemon = True
-    backend_thread.start()
+    # Check if API directory exists
+    if not API_DIR.exists():
+        print(f"\nERROR: API directory not found at {API_DIR}")
+        print("Please make sure the 'api' folder exists with the Flask application\n")
+        return
     
-    # Give the backend time to start
+    # Start backend as a child process and wait until it accepts connections
     print("Starting backend...")
-    time.sleep(2)
-    
-    # Start frontend
-    print("Starting frontend...")
-    run_frontend()
+    # The debug reloader would fork a child that outlives terminate() and keeps the port,
+    # so run the app in debug mode without it
+    backend = subprocess.Popen([sys.executable, "-c", BACKEND_NO_RELOAD_CODE], cwd=API_DIR)
+    try:
+        if not wait_for_port(BACKEND_PORT, process=backend):
+            print(f"WARNING: Backend is not accepting connections on port {BACKEND_PORT} yet.")
+        
+        # Start frontend
+        print("Starting frontend...")
+        run_frontend()
+    finally:
+        if backend.poll() is None:
+            backend.terminate()
+            backend.wait()
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
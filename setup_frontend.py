@@ -5,6 +5,7 @@ Node.js Frontend Setup Helper
 This script helps check Node.js installation and download it if needed.
 """
 
+import io
 import os
 import sys
 import subprocess
@@ -12,6 +13,7 @@ import platform
 import zipfile
 import shutil
 import tempfile
+import functools
 from pathlib import Path
 import urllib.request
 
@@ -20,6 +22,10 @@ BASE_DIR = Path(__file__).parent.absolute()
 WEB_DIR = BASE_DIR / "web"
 NODE_DIR = BASE_DIR / "node"
 
+# Read size used when downloading the Node.js archive
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+@functools.lru_cache(maxsize=1)
 def is_node_installed():
     """Check if Node.js is already available in PATH"""
     try:
@@ -74,20 +80,22 @@ def download_and_setup_node():
     
     # Get the appropriate download URL
     download_url = get_node_download_url()
-    node_filename = download_url.split("/")[-1]
     
-    # Create a temporary directory for the download
+    # Create a temporary directory for the extracted files
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
-        zip_path = temp_path / node_filename
         
-        # Download Node.js
+        # Download Node.js into memory in 1 MB chunks; the archive is never written to disk
         print(f"Downloading Node.js from {download_url}...")
-        urllib.request.urlretrieve(download_url, zip_path)
+        buffer = io.BytesIO()
+        with urllib.request.urlopen(download_url) as response:
+            for chunk in iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b''):
+                buffer.write(chunk)
+        buffer.seek(0)
         
         # Extract the zip file
         print("Extracting Node.js...")
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        with zipfile.ZipFile(buffer, 'r') as zip_ref:
             zip_ref.extractall(temp_path)
         
         # Find the extracted directory